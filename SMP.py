@@ -1,26 +1,44 @@
 import os
+import atexit
 import json
 import datetime
+import hashlib
+import mmap
+import time
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import logging
+import threading
 import traceback
+import types
+import weakref
 import sys
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from functools import partial
+from functools import lru_cache, partial
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                            QPushButton, QLabel, QLineEdit, QComboBox, QScrollArea, 
                            QGridLayout, QFrame, QFileDialog, QMessageBox, QProgressBar, 
                            QTabWidget, QTextEdit, QSplashScreen, QDialog, QFormLayout,
                            QCheckBox, QSpinBox, QStyleFactory, QGroupBox, QGraphicsOpacityEffect,
-                           QRadioButton, QButtonGroup, QToolButton, QMenu, QSizePolicy, QSpacerItem, QGraphicsDropShadowEffect)
+                           QRadioButton, QButtonGroup, QToolButton, QMenu, QSizePolicy, QSpacerItem, QGraphicsDropShadowEffect,
+                           QPlainTextEdit)
 from PyQt6.QtCore import (Qt, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot, QSize, 
                         QTimer, QUrl, QPropertyAnimation, QEasingCurve, QRect, QRectF, QPoint, QEvent,
                         QParallelAnimationGroup, QSequentialAnimationGroup, QAbstractAnimation,
-                        pyqtProperty, QDateTime)
-from PyQt6.QtGui import (QPixmap, QImage, QFont, QIcon, QColor, QPalette, QDesktopServices, 
-                       QFontDatabase, QPainter, QPen, QBrush, QCursor, QLinearGradient, 
-                       QTransform, QPageSize, QKeySequence, QShortcut, QPainterPath)
+                        pyqtProperty, QDateTime, QRegularExpression)
+from PyQt6.QtGui import (QPixmap, QPixmapCache, QImage, QFont, QIcon, QColor, QPalette, QDesktopServices,
+                       QFontDatabase, QPainter, QPen, QBrush, QCursor, QLinearGradient,
+                       QTransform, QPageSize, QKeySequence, QShortcut, QPainterPath,
+                       QRegularExpressionValidator)
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+try:
+    import orjson  # Optional: faster JSON if available
+except ImportError:
+    orjson = None
+
 import vrchatapi
 from vrchatapi.api import authentication_api, files_api, avatars_api
 from vrchatapi.exceptions import UnauthorizedException, ApiException
@@ -78,25 +96,482 @@ THEME = {
     }
 }
 
-# Ensure directories exist
-os.makedirs(DATA_FOLDER, exist_ok=True)
-os.makedirs(IMAGES_FOLDER, exist_ok=True)
-os.makedirs(CACHE_FOLDER, exist_ok=True)
+# Prebuilt QColor mirrors of the palette plus the pens/brushes used by the
+# theme-switch animation, so its 60 Hz paintEvent does zero allocations
+_QCOLORS = {mode: {name: QColor(value) for name, value in colors.items()}
+            for mode, colors in THEME.items()}
+_WHITE_PEN = QPen(QColor(255, 255, 255), 1)
+_WHITE_BRUSH = QBrush(QColor(255, 255, 255))
+
+# Shared QFont variants. QFont is implicitly shared, so building these
+# once avoids touching the font machinery per widget construction
+FONT_H1 = QFont('Segoe UI', 24, QFont.Weight.Bold)
+FONT_TITLE = QFont('Segoe UI', 18, QFont.Weight.Bold)
+FONT_SUBTITLE = QFont('Segoe UI', 14, QFont.Weight.Bold)
+FONT_CARD_NAME = QFont('Segoe UI', 13, QFont.Weight.Bold)
+FONT_BUTTON = QFont('Segoe UI', 12, QFont.Weight.Bold)
+FONT_BODY = QFont('Segoe UI', 14)
+FONT_SMALL = QFont('Segoe UI', 10)
+FONT_CODE = QFont('Consolas', 10)
+FONT_CODE_BIG = QFont('Segoe UI', 24)
+
+# Ensure directories exist. os.path.isdir is a single stat, whereas
+# makedirs walks every parent, so warm launches do three cheap checks
+# and no directory syscalls.
+for _folder in (DATA_FOLDER, IMAGES_FOLDER, CACHE_FOLDER):
+    if not os.path.isdir(_folder):
+        os.makedirs(_folder, exist_ok=True)
+
+# Shared HTTP session for thumbnail downloads. Connection pooling keeps
+# keep-alive sockets open to the VRChat CDN so a grid of cards reuses a
+# handful of TLS connections instead of paying a handshake per image.
+# requests.Session is thread-safe for GETs, so workers can share it.
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+# The subset of each avatar record the UI actually renders or searches on;
+# list responses are trimmed to these keys before they are cached
+_AVATAR_FIELDS = (
+    "id", "name", "authorName", "description",
+    "thumbnailImageUrl", "imageUrl", "releaseStatus",
+)
+
+# Characters not allowed in filenames on Windows; compiled once so every
+# download shares the same pattern object
+_SAFE_NAME_RE = re.compile(r'[\\/:*?"<>|]')
+
+# Palette adjustment helpers. The palette only has ~14 colors and a handful
+# of amounts, so memoizing collapses repeated hex parse/format cycles into
+# dict hits when many widgets restyle at once.
+@lru_cache(maxsize=256)
+def _lighten_color(color, amount=30):
+    # Convert hex to RGB
+    color = color.lstrip('#')
+    r, g, b = bytes.fromhex(color)
+
+    # Lighten
+    r = min(255, r + amount)
+    g = min(255, g + amount)
+    b = min(255, b + amount)
+
+    # Convert back to hex
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+@lru_cache(maxsize=256)
+def _darken_color(color, amount=30):
+    # Convert hex to RGB
+    color = color.lstrip('#')
+    r, g, b = bytes.fromhex(color)
+
+    # Darken
+    r = max(0, r - amount)
+    g = max(0, g - amount)
+    b = max(0, b - amount)
+
+    # Convert back to hex
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+@lru_cache(maxsize=256)
+def _adjust_color(color, amount):
+    """Lighten (positive amount) or darken (negative) a hex color"""
+    # Convert hex to RGB
+    color = color.lstrip('#')
+    r, g, b = bytes.fromhex(color)
+
+    # Adjust based on amount (positive = lighten, negative = darken)
+    if amount > 0:
+        r = min(255, r + amount)
+        g = min(255, g + amount)
+        b = min(255, b + amount)
+    else:
+        r = max(0, r + amount)
+        g = max(0, g + amount)
+        b = max(0, b + amount)
+
+    # Convert back to hex
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+# Warm the memo cache with the variants the buttons actually use so the
+# first paint doesn't pay the parse cost
+for _variant in THEME.values():
+    _lighten_color(_variant["primary"], 20)
+    _darken_color(_variant["primary"], 10)
+    _adjust_color(_variant["primary"], 40)
+    _adjust_color(_variant["primary"], -40)
+
+# Cache of fully formatted stylesheet strings keyed by
+# (widget kind, variant, theme key). Widgets reuse the exact same string
+# instead of rebuilding big f-strings per construction/hover, which also
+# lets Qt's stylesheet engine hit its internal parse cache.
+_STYLE_CACHE = {}
+
+# Widgets that restyle themselves on theme changes register here at
+# construction; a theme toggle walks this set instead of findChildren
+# over the entire widget tree. WeakSet so closed dialogs fall out.
+_THEMED_WIDGETS = weakref.WeakSet()
+
+def _cached_style(key, builder):
+    """Return the cached stylesheet for a key, building it on first use"""
+    style = _STYLE_CACHE.get(key)
+    if style is None:
+        style = _STYLE_CACHE[key] = builder()
+    return style
+
+def _theme_key():
+    return "dark" if is_dark_mode else "light"
+
+# Indexed by the is_dark_mode bool: no conditional and no string hashing
+# at the many call sites that just want the active palette. The proxies
+# make the shared palettes read-only, so worker threads can look up
+# colors without any risk of a stray mutation under them.
+_THEMES_BY_MODE = (types.MappingProxyType(THEME["light"]),
+                   types.MappingProxyType(THEME["dark"]))
+
+def _theme():
+    """Return the active theme palette dict"""
+    return _THEMES_BY_MODE[is_dark_mode]
+
+# QSS-referenced icons are materialized as real files so the stylesheet
+# stays short and Qt resolves the icon by path (which its pixmap cache can
+# key on) instead of re-parsing an inline data: URL on every style rebuild.
+# The project has no .qrc build step, so the cache folder stands in for a
+# compiled resource bundle.
+_CHECKMARK_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="14" height="14" viewBox="0 0 24 24"'
+    ' fill="none" stroke="white" stroke-width="2" stroke-linecap="round"'
+    ' stroke-linejoin="round"><polyline points="20 6 9 17 4 12"></polyline></svg>'
+)
+
+def _qss_asset(name, content):
+    """Write a stylesheet asset to the cache folder once and return its path"""
+    path = os.path.join(CACHE_FOLDER, name)
+    try:
+        if not os.path.isfile(path):
+            with open(path, 'w') as f:
+                f.write(content)
+    except OSError as e:
+        logger.warning(f"Could not write stylesheet asset {name}: {e}")
+    return path.replace("\\", "/")
+
+def _build_global_qss():
+    """Build the app-wide stylesheet for dialogs and pagination chrome.
+
+    One stylesheet attached to the QApplication replaces the per-widget
+    setStyleSheet calls in LoginDialog/TwoFactorDialog/PaginationWidget;
+    Qt's stylesheet cost scales with the number of attached stylesheets,
+    so those widgets now just carry an objectName for the selectors.
+    """
+    theme = _theme()
+    return f"""
+        QDialog#loginDialog, QDialog#twoFactorDialog {{
+            background-color: {theme["background"]};
+            border-radius: 10px;
+        }}
+        QDialog#loginDialog QLabel, QDialog#twoFactorDialog QLabel {{
+            color: {theme["text"]};
+        }}
+        QDialog#loginDialog QCheckBox {{
+            color: {theme["text"]};
+        }}
+        QDialog#loginDialog QCheckBox::indicator {{
+            width: 18px;
+            height: 18px;
+            border: 1px solid {theme["divider"]};
+            border-radius: 3px;
+        }}
+        QDialog#loginDialog QCheckBox::indicator:checked {{
+            background-color: {theme["primary"]};
+            border: 1px solid {theme["primary"]};
+            image: url('{_qss_asset("checkbox_checked.svg", _CHECKMARK_SVG)}');
+        }}
+        QLineEdit#twoFactorCode {{
+            background-color: {theme["surface"]};
+            color: {theme["text"]};
+            border: 1px solid {theme["divider"]};
+            border-radius: 8px;
+            padding: 8px;
+            letter-spacing: 10px;
+        }}
+        QLineEdit#twoFactorCode:focus {{
+            border: 2px solid {theme["primary"]};
+        }}
+        PaginationWidget QComboBox {{
+            background-color: {theme["surface"]};
+            color: {theme["text"]};
+            border: 1px solid {theme["divider"]};
+            border-radius: 6px;
+            padding: 4px 8px;
+            min-width: 120px;
+        }}
+        PaginationWidget QComboBox::drop-down {{
+            border: none;
+        }}
+        PaginationWidget QComboBox QAbstractItemView {{
+            background-color: {theme["card"]};
+            color: {theme["text"]};
+            border: 1px solid {theme["divider"]};
+            selection-background-color: {theme["primary"]};
+            selection-color: white;
+        }}
+        AvatarCard {{
+            background-color: {theme["card"]};
+            border-radius: 12px;
+            border: 1px solid {theme["divider"]};
+        }}
+        AvatarCard[hovered="true"] {{
+            border: 1px solid {theme["primary"]};
+        }}
+        AvatarCard[scrolling="true"] {{
+            background-color: {theme["surface"]};
+        }}
+        AvatarCard QLabel {{
+            background-color: transparent;
+            color: {theme["text"]};
+        }}
+        AvatarCard QFrame#cardImage {{
+            background-color: {theme["surface"]};
+            border-top-left-radius: 12px;
+            border-top-right-radius: 12px;
+            border-bottom: 1px solid {theme["divider"]};
+        }}
+        AvatarCard QLabel#cardAuthor {{
+            color: {theme["text_secondary"]};
+        }}
+        AvatarCard QLabel#cardDesc {{
+            color: {theme["text_secondary"]};
+            font-style: italic;
+            font-size: 9pt;
+        }}
+        QLabel#toast {{
+            background-color: {theme["card"]};
+            color: {theme["text"]};
+            border: 1px solid {theme["primary"]};
+            border-radius: 8px;
+            padding: 10px 18px;
+        }}
+    """
+
+def _apply_global_qss():
+    """Attach the (cached) app-wide stylesheet to the QApplication"""
+    app = QApplication.instance()
+    if app is not None:
+        app.setStyleSheet(_cached_style(("app", "global", _theme_key()), _build_global_qss))
+
+# Scaled thumbnails are cached in Qt's built-in QPixmapCache keyed by URL.
+# QPixmap is refcounted and reference-shared, so cards showing the same
+# avatar point at one underlying image. The cache limit is raised in main().
+# QPixmapCache is GUI-thread only, which matches where these are called.
+def _cached_pixmap(url):
+    """Return the cached scaled pixmap for a URL, or None on miss"""
+    pixmap = QPixmap()
+    if QPixmapCache.find(url, pixmap):
+        return pixmap
+    return None
+
+def _store_pixmap(url, pixmap):
+    """Insert a scaled pixmap into the shared pixmap cache"""
+    QPixmapCache.insert(url, pixmap)
+
+# One placeholder pixmap per theme, shared by every loading card through
+# QPixmap's implicit sharing rather than rendered per card
+_PLACEHOLDER_PIXMAPS = {}
+
+def _placeholder_pixmap():
+    """Return the shared placeholder shown while a thumbnail loads"""
+    key = _theme_key()
+    pixmap = _PLACEHOLDER_PIXMAPS.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(300, 180)
+        pixmap.fill(QColor(_theme()["surface"]))
+        _PLACEHOLDER_PIXMAPS[key] = pixmap
+    return pixmap
+
+def _image_cache_path(url):
+    """Map an image URL to its on-disk cache file"""
+    return os.path.join(CACHE_FOLDER, hashlib.sha1(url.encode('utf-8')).hexdigest() + ".bin")
+
+def _read_cached_image(url):
+    """Return cached image bytes for a URL from disk, or None"""
+    path = _image_cache_path(url)
+    try:
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                return f.read()
+    except OSError as e:
+        logger.warning(f"Failed to read cached image {path}: {e}")
+    return None
+
+def _write_cached_image(url, data):
+    """Store downloaded image bytes on disk for future sessions"""
+    path = _image_cache_path(url)
+    try:
+        with open(path, 'wb') as f:
+            f.write(data)
+    except OSError as e:
+        logger.warning(f"Failed to write cached image {path}: {e}")
+
+class _ThumbStore:
+    """Decoded-thumbnail cache: one memory-mapped blob of raw pixel data.
+
+    The per-URL .bin files above cache the *encoded* bytes, so a warm
+    start still pays a JPEG decode plus a smooth rescale per card. This
+    store appends the already-scaled pixels to a single thumbs.bin and
+    keeps a small {sha1(url): (offset, len, w, h, bpl, fmt)} index next
+    to it, so the next launch maps one file and rebuilds each thumbnail
+    with a memcpy instead of a decode and hundreds of small file opens.
+
+    Appends land on disk immediately but are served from disk only on
+    the next launch; within a session the decoded image is already held
+    by QPixmapCache, so remapping the growing file buys nothing.
+
+    The blob is capped: once it would grow past _MAX_BIN_BYTES the store
+    is reset and repopulates from the avatars actually being viewed. The
+    index is flushed every _FLUSH_EVERY puts and at exit rather than per
+    put, so writing it stays cheap as the store fills up; entries whose
+    index write is lost re-append on the next run.
+    """
+
+    # ~600 thumbnails at 250x250 RGBA; reset rather than compact beyond this
+    _MAX_BIN_BYTES = 128 * 1024 * 1024
+    _FLUSH_EVERY = 64
+
+    def __init__(self):
+        self._bin_path = os.path.join(CACHE_FOLDER, "thumbs.bin")
+        self._idx_path = os.path.join(CACHE_FOLDER, "thumbs.idx")
+        self._lock = threading.Lock()
+        self._mm = None
+        self._index = {}
+        self._loaded = False
+        self._unflushed = 0
+        atexit.register(self.flush)
+
+    def _ensure_loaded(self):
+        # Deferred to first use so startup never stalls on the cache dir
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            if os.path.isfile(self._idx_path) and os.path.getsize(self._bin_path) > 0:
+                if os.path.getsize(self._bin_path) > self._MAX_BIN_BYTES:
+                    # A previous session grew past the cap; start over
+                    logger.info("Thumbnail store over size cap, resetting")
+                    self._reset_locked()
+                    return
+                with open(self._idx_path, 'rb') as f:
+                    payload = f.read()
+                self._index = orjson.loads(payload) if orjson else json.loads(payload)
+                with open(self._bin_path, 'rb') as f:
+                    self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Thumbnail store unavailable, rebuilding: {e}")
+            self._index = {}
+            self._mm = None
+
+    def _reset_locked(self):
+        """Drop the blob and index; callers hold self._lock"""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._index = {}
+        self._unflushed = 0
+        try:
+            with open(self._bin_path, 'wb'):
+                pass
+            if os.path.isfile(self._idx_path):
+                os.remove(self._idx_path)
+        except OSError as e:
+            logger.warning(f"Failed to reset thumbnail store: {e}")
+
+    def _flush_locked(self):
+        """Persist the index; callers hold self._lock"""
+        if not self._unflushed:
+            return
+        try:
+            if orjson:
+                payload = orjson.dumps(self._index)
+            else:
+                payload = json.dumps(self._index).encode('utf-8')
+            tmp_path = self._idx_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self._idx_path)
+            self._unflushed = 0
+        except OSError as e:
+            logger.warning(f"Failed to write thumbnail index: {e}")
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def get(self, url):
+        """Return the cached scaled QImage for a URL, or None"""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._index.get(key)
+            mm = self._mm
+        if entry is None or mm is None:
+            return None
+        offset, length, width, height, bpl, fmt = entry
+        data = mm[offset:offset + length]
+        if len(data) != length:
+            return None
+        # The mmap slice is an independent bytes object; copy() detaches
+        # the QImage from it so its lifetime doesn't matter afterwards
+        return QImage(data, width, height, bpl, QImage.Format(fmt)).copy()
+
+    def put(self, url, image):
+        """Append a scaled QImage's raw pixels to the blob"""
+        if image is None or image.isNull():
+            return
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        ptr = image.constBits()
+        ptr.setsize(image.sizeInBytes())
+        data = bytes(ptr)
+        with self._lock:
+            self._ensure_loaded()
+            if key in self._index:
+                return
+            try:
+                offset = os.path.getsize(self._bin_path) if os.path.isfile(self._bin_path) else 0
+                if offset + len(data) > self._MAX_BIN_BYTES:
+                    # Cap reached mid-session; drop everything and let
+                    # the thumbnails actually being viewed repopulate
+                    self._reset_locked()
+                    offset = 0
+                with open(self._bin_path, 'ab') as f:
+                    f.write(data)
+                self._index[key] = [offset, len(data), image.width(),
+                                    image.height(), image.bytesPerLine(),
+                                    int(image.format().value)]
+                self._unflushed += 1
+                if self._unflushed >= self._FLUSH_EVERY:
+                    self._flush_locked()
+            except OSError as e:
+                logger.warning(f"Failed to append to thumbnail store: {e}")
+
+_THUMB_STORE = _ThumbStore()
+
+# Signals container for Worker, defined once at module scope so the class
+# dict (and its four signal descriptors) isn't nested inside every Worker
+class WorkerSignals(QObject):
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+    result = pyqtSignal(object)
+    progress = pyqtSignal(int, str)
 
 # The Worker class for background tasks
 class Worker(QRunnable):
-    class Signals(QObject):
-        finished = pyqtSignal()
-        error = pyqtSignal(str)
-        result = pyqtSignal(object)
-        progress = pyqtSignal(int, str)
-
     def __init__(self, fn, *args, **kwargs):
         super(Worker, self).__init__()
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
-        self.signals = Worker.Signals()
+        self.signals = WorkerSignals()
 
     @pyqtSlot()
     def run(self):
@@ -118,6 +593,187 @@ class Worker(QRunnable):
             # Always emit finished signal
             self.signals.finished.emit()
 
+def _cookies_for(api_client):
+    """Return a cookie dict for the client, rebuilding only when the jar changes.
+
+    Iterating the CookieJar takes its internal lock and allocates a fresh
+    dict; with dozens of concurrent fetches that work is identical every
+    time, so cache the dict on the client keyed by a jar snapshot.
+    """
+    if api_client is None:
+        return {}
+    jar = api_client.rest_client.cookie_jar
+    snapshot = (id(jar), len(jar))
+    if getattr(api_client, '_cached_cookies_key', None) == snapshot:
+        return api_client._cached_cookies
+    cookies = requests.utils.dict_from_cookiejar(jar)
+    api_client._cached_cookies = cookies
+    api_client._cached_cookies_key = snapshot
+    return cookies
+
+def _invalidate_cookies(api_client):
+    """Drop the cached cookie dict so the next request re-reads the jar.
+
+    The jar snapshot key catches added/removed cookies, but not a value
+    rotated in place — call this on a 401 so a refreshed auth cookie is
+    picked up.
+    """
+    if api_client is not None:
+        api_client._cached_cookies_key = None
+
+def _headers_for(api_client):
+    """Return the standard API request headers, cached on the client.
+
+    The user agent never changes after login, so every fetch path can
+    share one dict instead of rebuilding it per request.
+    """
+    headers = getattr(api_client, '_cached_headers', None)
+    if headers is None:
+        headers = {
+            "User-Agent": api_client.user_agent,
+            "Accept": "application/json"
+        }
+        api_client._cached_headers = headers
+    return headers
+
+# Shared thumbnail fetcher. One bounded pool and one precomputed
+# header/cookie pair serve every card, instead of each AvatarCard building
+# its own Worker, headers, and cookie dict per image.
+class ImageFetcher(QObject):
+    # Internal signal used to marshal results back to the GUI thread
+    _delivered = pyqtSignal(object, object)
+
+    def __init__(self):
+        super().__init__()
+        # Thumbnail fetches are network-bound and release the GIL inside
+        # requests/socket reads, so 16-way concurrency fills a 50-card page
+        # much faster than the CPU-sized default without starving the
+        # QThreadPool used for login/fetch/download work
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="thumb")
+        self._api_client = None
+        self._headers = {
+            "User-Agent": f"{APP_NAME}/{APP_VERSION}",
+            "Accept": "*/*"
+        }
+        # URLs currently being fetched, mapped to their waiting callbacks,
+        # so duplicate cards on one page share a single download
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        # URLs that failed this session; rebinding a pooled card to the
+        # same avatar should not retry a known-dead URL every page turn
+        self._failed = set()
+        self._delivered.connect(self._dispatch)
+
+    def set_api_client(self, api_client):
+        """Recompute the headers once per login instead of per request"""
+        self._api_client = api_client
+        if api_client is not None:
+            self._headers = {
+                "User-Agent": api_client.user_agent,
+                "Accept": "*/*"
+            }
+        else:
+            self._headers = {
+                "User-Agent": f"{APP_NAME}/{APP_VERSION}",
+                "Accept": "*/*"
+            }
+
+    def fetch(self, url, callback, fast=False):
+        """Fetch a thumbnail and deliver the scaled QImage on the GUI thread.
+
+        With fast=True the scale uses FastTransformation, trading quality
+        for speed while the grid is actively scrolling.
+        """
+        if url in self._failed:
+            # Known-dead URL; report failure without re-downloading
+            callback(None)
+            return
+        with self._pending_lock:
+            waiters = self._pending.get(url)
+            if waiters is not None:
+                # A fetch for this URL is already in flight; piggyback on it
+                waiters.append(callback)
+                return
+            self._pending[url] = [callback]
+        self._executor.submit(self._fetch_one, url, fast)
+
+    def prefetch(self, urls):
+        """Warm the disk cache for a batch of URLs in the background.
+
+        Used to pull in the next page's thumbnails while the user is still
+        looking at the current one; nothing is delivered back to the GUI.
+        """
+        for url in urls:
+            if url and not os.path.isfile(_image_cache_path(url)):
+                self._executor.submit(self._load, url)
+
+    def _fetch_one(self, url, fast=False):
+        image = self._load(url, fast)
+        if image is None and not fast:
+            self._failed.add(url)
+        with self._pending_lock:
+            waiters = self._pending.pop(url, [])
+        for callback in waiters:
+            self._delivered.emit(callback, image)
+
+    def _load(self, url, fast=False):
+        try:
+            # Raw-pixel store first: a hit skips the decode entirely (and
+            # is already smooth-scaled, so it also satisfies fast requests)
+            image = _THUMB_STORE.get(url)
+            if image is not None and not image.isNull():
+                return image
+
+            # Check the on-disk cache before hitting the network
+            image_data = _read_cached_image(url)
+
+            if image_data is None:
+                response = _HTTP.get(
+                    url,
+                    headers=self._headers,
+                    cookies=_cookies_for(self._api_client),
+                    timeout=10
+                )
+                if response.status_code != 200:
+                    return None
+                image_data = response.content
+                # Cache the raw bytes so future sessions skip the download
+                _write_cached_image(url, image_data)
+
+            # Decode and smooth-scale here on the pool thread. QImage is
+            # safe to build off the GUI thread (QPixmap is not), so the
+            # expensive JPEG decode + resample stays out of the event loop.
+            image = QImage()
+            if not image.loadFromData(image_data):
+                return None
+            mode = (Qt.TransformationMode.FastTransformation if fast
+                    else Qt.TransformationMode.SmoothTransformation)
+            scaled = image.scaled(300, 180, Qt.AspectRatioMode.KeepAspectRatio, mode)
+            if not fast:
+                # Persist the decoded pixels so the next launch skips the
+                # decode; fast scales are throwaway quality, don't keep them
+                _THUMB_STORE.put(url, scaled)
+            return scaled
+        except Exception as e:
+            logger.error(f"Error downloading image: {e}")
+        return None
+
+    def _dispatch(self, callback, image):
+        try:
+            callback(image)
+        except RuntimeError:
+            # The receiving card was deleted while the fetch was in flight
+            pass
+
+_image_fetcher = None
+
+def image_fetcher():
+    """Return the process-wide ImageFetcher, creating it on first use"""
+    global _image_fetcher
+    if _image_fetcher is None:
+        _image_fetcher = ImageFetcher()
+    return _image_fetcher
+
 # Custom Button with hover effects
 class AnimatedButton(QPushButton):
     def __init__(self, text="", parent=None, primary=True, icon=None):
@@ -134,23 +790,34 @@ class AnimatedButton(QPushButton):
         self._opacity = 1.0
         self._hovered = False
         self._pressed = False
-        
+
+        # One reusable press animation; clicks reset it in place instead
+        # of allocating a new QPropertyAnimation per press/release
+        self._press_anim = QPropertyAnimation(self, b"geometry")
+        self._press_anim.setDuration(100)
+
         # Default style
         self.update_style()
-    
+        _THEMED_WIDGETS.add(self)
+
     def update_style(self):
-        theme = app_theme["dark" if is_dark_mode else "light"]
-        
+        variant = "primary" if self.primary else "secondary"
+        key = ("AnimatedButton", variant, _theme_key())
+        self.setStyleSheet(_cached_style(key, self._build_style))
+
+    def _build_style(self):
+        theme = _theme()
+
         if self.primary:
             base_color = theme["primary"]
-            hover_color = self._lighten_color(base_color, 20) if is_dark_mode else self._darken_color(base_color, 10)
+            hover_color = _lighten_color(base_color, 20) if is_dark_mode else _darken_color(base_color, 10)
             text_color = "#FFFFFF"
         else:
             base_color = theme["surface"]
             hover_color = theme["hover"]
             text_color = theme["text"]
-        
-        self.setStyleSheet(f"""
+
+        return f"""
             AnimatedButton {{
                 background-color: {base_color};
                 color: {text_color};
@@ -170,34 +837,8 @@ class AnimatedButton(QPushButton):
                 background-color: {theme["inactive"]};
                 color: {theme["text_secondary"]};
             }}
-        """)
+        """
 
-    def _lighten_color(self, color, amount=30):
-        # Convert hex to RGB
-        color = color.lstrip('#')
-        r, g, b = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
-        
-        # Lighten
-        r = min(255, r + amount)
-        g = min(255, g + amount)
-        b = min(255, b + amount)
-        
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
-    
-    def _darken_color(self, color, amount=30):
-        # Convert hex to RGB
-        color = color.lstrip('#')
-        r, g, b = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
-        
-        # Darken
-        r = max(0, r - amount)
-        g = max(0, g - amount)
-        b = max(0, b - amount)
-        
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
-    
     def enterEvent(self, event):
         self._hovered = True
         self.update()
@@ -211,29 +852,25 @@ class AnimatedButton(QPushButton):
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self._pressed = True
-            
-            # Create a "press" animation
-            self.anim = QPropertyAnimation(self, b"geometry")
-            self.anim.setDuration(100)
-            rect = self.geometry()
-            
+
             # Shrink slightly when pressed
+            rect = self.geometry()
             target = QRect(rect.x()+1, rect.y()+1, rect.width()-2, rect.height()-2)
-            self.anim.setEndValue(target)
-            self.anim.start()
-            
+            self._press_anim.stop()
+            self._press_anim.setEndValue(target)
+            self._press_anim.start()
+
         super().mousePressEvent(event)
-    
+
     def mouseReleaseEvent(self, event):
         if self._pressed:
             self._pressed = False
-            
-            # Create a "release" animation
-            self.anim = QPropertyAnimation(self, b"geometry")
-            self.anim.setDuration(100)
-            self.anim.setEndValue(self.geometry().adjusted(-1, -1, 1, 1))
-            self.anim.start()
-            
+
+            # Grow back on release
+            self._press_anim.stop()
+            self._press_anim.setEndValue(self.geometry().adjusted(-1, -1, 1, 1))
+            self._press_anim.start()
+
         super().mouseReleaseEvent(event)
     
     def setTheme(self, is_dark):
@@ -247,14 +884,11 @@ class AnimatedLineEdit(QLineEdit):
         
         # Initialize state
         self._focused = False
-        
-        # Set up animations
-        self.focusAnim = QPropertyAnimation(self, b"styleSheet")
-        self.focusAnim.setDuration(200)
-        
+
         # Initial style
         self.update_style()
-        
+        _THEMED_WIDGETS.add(self)
+
         # Add icon if provided
         if icon:
             self.setTextMargins(30, 0, 0, 0)
@@ -274,13 +908,17 @@ class AnimatedLineEdit(QLineEdit):
         super().resizeEvent(event)
     
     def update_style(self):
-        theme = app_theme["dark" if is_dark_mode else "light"]
+        key = ("AnimatedLineEdit", "base", _theme_key())
+        self.setStyleSheet(_cached_style(key, self._build_style))
+
+    def _build_style(self):
+        theme = _theme()
         bg_color = theme["surface"]
         border_color = theme["divider"]
         text_color = theme["text"]
         focus_color = theme["primary"]
-        
-        self.setStyleSheet(f"""
+
+        return f"""
             AnimatedLineEdit {{
                 background-color: {bg_color};
                 color: {text_color};
@@ -292,34 +930,18 @@ class AnimatedLineEdit(QLineEdit):
             AnimatedLineEdit:focus {{
                 border: 2px solid {focus_color};
             }}
-        """)
+        """
     
     def focusInEvent(self, event):
+        # The :focus rule in the cached stylesheet handles the border;
+        # animating the styleSheet property would re-parse CSS per tick
         self._focused = True
-        theme = app_theme["dark" if is_dark_mode else "light"]
-        focus_color = theme["primary"]
-        
-        # Set up the animation
-        self.focusAnim.setStartValue(self.styleSheet())
-        new_style = self.styleSheet().replace("border: 1px solid", f"border: 2px solid {focus_color}")
-        self.focusAnim.setEndValue(new_style)
-        self.focusAnim.start()
-        
         super().focusInEvent(event)
-    
+
     def focusOutEvent(self, event):
         self._focused = False
-        theme = app_theme["dark" if is_dark_mode else "light"]
-        border_color = theme["divider"]
-        
-        # Set up the animation
-        self.focusAnim.setStartValue(self.styleSheet())
-        new_style = self.styleSheet().replace("border: 2px solid", f"border: 1px solid {border_color}")
-        self.focusAnim.setEndValue(new_style)
-        self.focusAnim.start()
-        
         super().focusOutEvent(event)
-    
+
     def setTheme(self, is_dark):
         self.update_style()
 
@@ -329,15 +951,17 @@ class AvatarCard(QFrame):
     
     def __init__(self, avatar_data, api_client=None, parent=None):
         super().__init__(parent)
-        
-        if hasattr(self, 'download_btn'):
-            self.download_btn.deleteLater()
-            
-        self.download_btn = AnimatedButton("Download", primary=True)
-        self.download_btn.setFixedHeight(36)
-        self.download_btn.clicked.connect(self.request_download)
+
         self.avatar_data = avatar_data
         self.api_client = api_client
+
+        # Scroll-aware image quality: while scrolling we accept a fast,
+        # lower-quality scale and re-request the smooth version afterwards
+        self._is_scrolling = False
+        self._fast_scaled = False
+
+        # Not registered in _THEMED_WIDGETS: all card styling comes from
+        # the application stylesheet, which re-themes every card at once
         self.setup_ui()
         
         # Set up card hover animation
@@ -349,39 +973,35 @@ class AvatarCard(QFrame):
         self.download_anim = QPropertyAnimation(self.download_btn, b"pos")
         self.download_anim.setDuration(150)
         self.download_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+
+        # Throttle hover handling so sweeping the mouse across the grid
+        # coalesces enter/leave bursts into at most one apply per 50 ms
+        self._pending_hover = False
+        self._applied_hover = False
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(50)
+        self._hover_timer.timeout.connect(self._apply_hover)
         
     def setup_ui(self):
-        # Set card appearance
-        theme = app_theme["dark" if is_dark_mode else "light"]
-        
+        # Card styling lives in the application-wide stylesheet (see
+        # _build_global_qss): AvatarCard rules there cost one parse for
+        # the whole grid, with the hover/scroll looks driven by dynamic
+        # properties. This method only assigns the objectNames those
+        # selectors key on.
         self.setFrameShape(QFrame.Shape.NoFrame)
         self.setFixedSize(300, 340)
-        self.setStyleSheet(f"""
-            AvatarCard {{
-                background-color: {theme["card"]};
-                border-radius: 12px;
-                border: 1px solid {theme["divider"]};
-            }}
-            QLabel {{
-                background-color: transparent;
-                color: {theme["text"]};
-            }}
-        """)
-        
+        self.setProperty("hovered", "false")
+
         # Main layout with no margins for full-bleed image
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
-        
+
         # Image container at the top - spans the full width
         self.image_container = QFrame(self)
+        self.image_container.setObjectName("cardImage")
         self.image_container.setFixedHeight(180)
-        self.image_container.setStyleSheet(f"""
-            background-color: {theme["surface"]};
-            border-top-left-radius: 12px;
-            border-top-right-radius: 12px;
-            border-bottom: 1px solid {theme["divider"]};
-        """)
         
         image_layout = QVBoxLayout(self.image_container)
         image_layout.setContentsMargins(0, 0, 0, 0)
@@ -397,7 +1017,7 @@ class AvatarCard(QFrame):
         
         # Content container for the rest of the card
         content_container = QWidget()
-        content_container.setStyleSheet(f"background-color: transparent;")
+        content_container.setStyleSheet("background-color: transparent;")
         content_layout = QVBoxLayout(content_container)
         content_layout.setContentsMargins(15, 15, 15, 15)
         content_layout.setSpacing(10)
@@ -405,27 +1025,26 @@ class AvatarCard(QFrame):
         # Avatar name with ellipsis for long names
         avatar_name = self.avatar_data.get('name', 'Unknown Avatar')
         self.name_label = QLabel(avatar_name)
-        self.name_label.setFont(QFont('Segoe UI', 13, QFont.Weight.Bold))
+        self.name_label.setFont(FONT_CARD_NAME)
         self.name_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
         self.name_label.setWordWrap(True)
         self.name_label.setMaximumHeight(40)
-        self.name_label.setStyleSheet(f"color: {theme['text']}; background-color: transparent;")
-        
+
         # Avatar author
         author_name = self.avatar_data.get('authorName', 'Unknown Author')
         self.author_label = QLabel(f"By: {author_name}")
-        self.author_label.setFont(QFont('Segoe UI', 10))
-        self.author_label.setStyleSheet(f"color: {theme['text_secondary']}; background-color: transparent;")
-        
+        self.author_label.setObjectName("cardAuthor")
+        self.author_label.setFont(FONT_SMALL)
+
         # Avatar description (truncated)
         description = self.avatar_data.get('description', '')
         if not description:
             description = "No description provided"
         truncated_desc = description[:80] + ('...' if len(description) > 80 else '')
         self.desc_label = QLabel(truncated_desc)
+        self.desc_label.setObjectName("cardDesc")
         self.desc_label.setWordWrap(True)
         self.desc_label.setFixedHeight(50)
-        self.desc_label.setStyleSheet(f"color: {theme['text_secondary']}; font-style: italic; font-size: 9pt; background-color: transparent;")
         
         # Download button
         self.download_btn = AnimatedButton("Download", primary=True)
@@ -447,93 +1066,97 @@ class AvatarCard(QFrame):
         
         self.setAutoFillBackground(True)
         self.raise_()  # Raise above any previous widgets
-        
+
+        # Preallocate the hover shadow once; hovering only toggles it on
+        # and off instead of allocating/installing a new effect each time
+        self._shadow = QGraphicsDropShadowEffect(self)
+        self._shadow.setBlurRadius(10)
+        self._shadow.setColor(QColor(0, 0, 0, 80))
+        self._shadow.setOffset(0, 4)
+        self._shadow.setEnabled(False)
+        self.setGraphicsEffect(self._shadow)
+
         # Load the avatar image
         self.load_avatar_image()
-    
-    def update_theme(self):
-        theme = app_theme["dark" if is_dark_mode else "light"]
-        
-        self.setStyleSheet(f"""
-            AvatarCard {{
-                background-color: {theme["card"]};
-                border-radius: 12px;
-                border: 1px solid {theme["divider"]};
-            }}
-            QLabel {{
-                background-color: transparent;
-                color: {theme["text"]};
-            }}
-        """)
-        
-        self.image_container.setStyleSheet(f"""
-            background-color: {theme["surface"]};
-            border-top-left-radius: 12px;
-            border-top-right-radius: 12px;
-            border-bottom: 1px solid {theme["divider"]};
-        """)
-        
-        self.name_label.setStyleSheet(f"color: {theme['text']}; background-color: transparent;")
-        self.author_label.setStyleSheet(f"color: {theme['text_secondary']}; background-color: transparent;")
-        self.desc_label.setStyleSheet(f"color: {theme['text_secondary']}; font-style: italic; font-size: 9pt; background-color: transparent;")
-        
+
+    def setAvatar(self, avatar_data):
+        """Rebind this card to another avatar without rebuilding widgets"""
+        self.avatar_data = avatar_data
+
+        self.name_label.setText(avatar_data.get('name', 'Unknown Avatar'))
+        self.author_label.setText(f"By: {avatar_data.get('authorName', 'Unknown Author')}")
+        description = avatar_data.get('description', '') or "No description provided"
+        self.desc_label.setText(description[:80] + ('...' if len(description) > 80 else ''))
+
+        self._reset_download_button()
+        self._fast_scaled = False
+        self.image_url = None
+        self.image_label.clear()
+        self.load_avatar_image()
+
     def load_avatar_image(self):
         # Use thumbnail if available, otherwise use image URL
         image_url = self.avatar_data.get('thumbnailImageUrl') or self.avatar_data.get('imageUrl')
         if not image_url:
             self.image_label.setText("No Image Available")
             return
-            
-        # Create a worker to download the image
-        worker = Worker(self.download_image, image_url)
-        worker.signals.result.connect(self.set_image)
-        worker.signals.error.connect(lambda error: self.image_label.setText(f"Error: {error}"))
-        QThreadPool.globalInstance().start(worker)
-    
-    def download_image(self, url):
-        try:
-            # Get cookies from the API client
-            cookies = {}
-            if self.api_client:
-                for cookie in self.api_client.rest_client.cookie_jar:
-                    cookies[cookie.name] = cookie.value
-                
-            headers = {
-                "User-Agent": self.api_client.user_agent if self.api_client else f"{APP_NAME}/{APP_VERSION}",
-                "Accept": "*/*"  # Accept any content type
-            }
-            
-            response = requests.get(
-                url,
-                headers=headers,
-                cookies=cookies
-            )
-            
-            if response.status_code == 200:
-                return response.content
-        except Exception as e:
-            logger.error(f"Error downloading image: {e}")
-        return None
+
+        self.image_url = image_url
+
+        # Reuse the cached scaled pixmap if we already decoded this URL
+        pixmap = _cached_pixmap(image_url)
+        if pixmap is not None:
+            self.image_label.setPixmap(pixmap)
+            return
+
+        # Show the shared placeholder until the fetch lands so rebound
+        # pool cards never flash the previous avatar or an empty label
+        self.image_label.setPixmap(_placeholder_pixmap())
+
+        # Hand off to the shared fetcher pool instead of a per-card Worker;
+        # use the cheap scale while the grid is scrolling
+        self._requested_fast = self._is_scrolling
+        image_fetcher().fetch(image_url, partial(self._deliver_image, image_url),
+                              fast=self._requested_fast)
+
+    def _deliver_image(self, url, image):
+        # Drop results for an avatar this card no longer shows (the card
+        # may have been rebound from the pool while the fetch was in flight)
+        if url != getattr(self, 'image_url', None):
+            return
+        self.set_image(image)
         
     def setScrollingMode(self, is_scrolling):
         """Toggle between normal and simplified rendering for scrolling"""
+        self._is_scrolling = is_scrolling
         if is_scrolling:
             # Simplified mode for scrolling - disable fancy effects
-            self.setGraphicsEffect(None)
+            # (keep the preallocated shadow installed, just switched off)
+            self._shadow.setEnabled(False)
             self.image_label.setGraphicsEffect(None)
             self.download_btn.setGraphicsEffect(None)
         else:
-            # Normal mode - can restore simple effects if needed
-            theme = app_theme["dark" if is_dark_mode else "light"]
-            self.update_theme()
-        
-    
-    def set_image(self, image_data):
-        if image_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_data)
-            scaled_pixmap = pixmap.scaled(300, 180, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            # Normal mode: the [scrolling="false"] repolish already put
+            # the full look back, so only the image needs attention.
+            # Upgrade a fast-scaled thumbnail to the smooth version now
+            # that scrolling has stopped
+            if self._fast_scaled:
+                self._fast_scaled = False
+                self.load_avatar_image()
+        
+    
+    def set_image(self, image):
+        if image is not None and not image.isNull():
+            # The worker already decoded and scaled; just wrap for display
+            scaled_pixmap = QPixmap.fromImage(image)
             self.image_label.setPixmap(scaled_pixmap)
+            if getattr(self, '_requested_fast', False):
+                # Low-quality scale; remember to re-request the smooth one
+                # and keep it out of the shared cache
+                self._fast_scaled = True
+            elif getattr(self, 'image_url', None):
+                # Share the scaled pixmap with any other card showing this avatar
+                _store_pixmap(self.image_url, scaled_pixmap)
         else:
             self.image_label.setText("Failed to load image")
     
@@ -544,49 +1167,55 @@ class AvatarCard(QFrame):
         
         # Signal to download the avatar
         self.downloadRequested.emit(self.avatar_data)
-        
+
         # Re-enable and reset button text after a delay
-        QTimer.singleShot(800, lambda: self.download_btn.setEnabled(True))
-        QTimer.singleShot(800, lambda: self.download_btn.setText("Download"))
+        QTimer.singleShot(800, self._reset_download_button)
+
+    def _reset_download_button(self):
+        self.download_btn.setEnabled(True)
+        self.download_btn.setText("Download")
     
+    def _set_hovered(self, hovered):
+        """Toggle the hover border via the dynamic property and repolish"""
+        self.setProperty("hovered", "true" if hovered else "false")
+        self.style().unpolish(self)
+        self.style().polish(self)
+
     def enterEvent(self, event):
-        # Scale up slightly when hovering
-        original_rect = self.geometry()
-        target_rect = original_rect.adjusted(-2, -2, 2, 2)
-        
-        self.hover_anim.setEndValue(target_rect)
-        self.hover_anim.start()
-        
-        # Add drop shadow when hovering using QGraphicsDropShadowEffect instead of box-shadow
-        theme = app_theme["dark" if is_dark_mode else "light"]
-        self.setStyleSheet(f"""
-            AvatarCard {{
-                background-color: {theme["card"]};
-                border-radius: 12px;
-                border: 1px solid {theme["primary"]};
-            }}
-            QLabel {{
-                background-color: transparent;
-                color: {theme["text"]};
-            }}
-        """)
-        
-        # Apply drop shadow effect
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        shadow.setOffset(0, 4)
-        self.setGraphicsEffect(shadow)
-        
+        self._pending_hover = True
+        self._hover_timer.start()
+
     def leaveEvent(self, event):
-        # Return to original size
-        original_rect = self.geometry().adjusted(2, 2, -2, -2)
-        
-        self.hover_anim.setEndValue(original_rect)
-        self.hover_anim.start()
-        
-        # Remove shadow
-        self.update_theme()
+        self._pending_hover = False
+        self._hover_timer.start()
+
+    def _apply_hover(self):
+        """Apply the most recent hover state once the throttle window closes"""
+        hovered = self._pending_hover
+        if hovered == self._applied_hover:
+            return
+        self._applied_hover = hovered
+
+        if hovered:
+            # Scale up slightly when hovering
+            target_rect = self.geometry().adjusted(-2, -2, 2, 2)
+            self.hover_anim.setEndValue(target_rect)
+            self.hover_anim.start()
+
+            # Highlight border via dynamic property instead of a stylesheet swap
+            self._set_hovered(True)
+
+            # Enable the preallocated drop shadow
+            self._shadow.setEnabled(True)
+        else:
+            # Return to original size
+            target_rect = self.geometry().adjusted(2, 2, -2, -2)
+            self.hover_anim.setEndValue(target_rect)
+            self.hover_anim.start()
+
+            # Restore normal border and disable the shadow
+            self._set_hovered(False)
+            self._shadow.setEnabled(False)
 
 # Theme Switch Button
 class ThemeSwitchButton(QWidget):
@@ -620,11 +1249,10 @@ class ThemeSwitchButton(QWidget):
         width = self.width()
         height = self.height()
         
-        # Get current colors based on theme
-        theme = app_theme["dark" if is_dark_mode else "light"]
-        bg_color = QColor(theme["background"])
-        track_color = QColor(theme["inactive"])
-        thumb_color = QColor(theme["primary"])
+        # Get current colors based on theme (prebuilt QColor objects)
+        qcolors = _QCOLORS["dark" if is_dark_mode else "light"]
+        track_color = qcolors["inactive"]
+        thumb_color = qcolors["primary"]
         
         # Draw the track
         track_path = QPainterPath()
@@ -650,21 +1278,21 @@ class ThemeSwitchButton(QWidget):
         
         if self.dark_mode:
             # Draw moon icon
-            painter.setPen(QPen(QColor(255, 255, 255), 1))
-            painter.setBrush(QBrush(QColor(255, 255, 255)))
+            painter.setPen(_WHITE_PEN)
+            painter.setBrush(_WHITE_BRUSH)
             painter.drawEllipse(icon_rect)
-            
+
             # Draw "bite" out of moon
             offset = icon_size * 0.3
-            painter.setBrush(QBrush(thumb_color))
+            painter.setBrush(thumb_color)
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(QRectF(icon_rect.x() + offset, 
-                                      icon_rect.y(), 
+            painter.drawEllipse(QRectF(icon_rect.x() + offset,
+                                      icon_rect.y(),
                                       icon_size, icon_size))
         else:
             # Draw sun icon
-            painter.setPen(QPen(QColor(255, 255, 255), 1))
-            painter.setBrush(QBrush(QColor(255, 255, 255)))
+            painter.setPen(_WHITE_PEN)
+            painter.setBrush(_WHITE_BRUSH)
             painter.drawEllipse(icon_rect)
     
     def mousePressEvent(self, event):
@@ -702,7 +1330,7 @@ class PaginationWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(10)  # Increased spacing
         
-        theme = app_theme["dark" if is_dark_mode else "light"]
+        theme = _theme()
         
         # Add spacer to push everything to center
         layout.addStretch(1)
@@ -740,30 +1368,14 @@ class PaginationWidget(QWidget):
         per_page_layout.setContentsMargins(15, 0, 0, 0)
         
         self.items_per_page_combo = QComboBox()
-        self.items_per_page_combo.addItems(["10 per page", "25 per page", "50 per page", "100 per page"])
+        # Carry the item count as userData so changing pages reads
+        # currentData() instead of re-mapping the index
+        for count in (10, 25, 50, 100):
+            self.items_per_page_combo.addItem(f"{count} per page", count)
         self.items_per_page_combo.setCurrentIndex(2)  # Default to 50
         self.items_per_page_combo.currentIndexChanged.connect(self.change_items_per_page)
-        self.items_per_page_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {theme["surface"]};
-                color: {theme["text"]};
-                border: 1px solid {theme["divider"]};
-                border-radius: 6px;
-                padding: 4px 8px;
-                min-width: 120px;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {theme["card"]};
-                color: {theme["text"]};
-                border: 1px solid {theme["divider"]};
-                selection-background-color: {theme["primary"]};
-                selection-color: white;
-            }}
-        """)
-        
+        # Styled by the app-wide stylesheet (PaginationWidget QComboBox)
+
         per_page_layout.addWidget(self.items_per_page_combo)
         
         # Add all components to main layout
@@ -803,10 +1415,8 @@ class PaginationWidget(QWidget):
             self.pageChanged.emit(self.current_page)
     
     def change_items_per_page(self, index):
-        # Map combo box index to item count
-        items_map = {0: 10, 1: 25, 2: 50, 3: 100}
-        new_items_per_page = items_map.get(index, 50)
-        
+        new_items_per_page = self.items_per_page_combo.currentData()
+
         # Only take action if this is a change
         if new_items_per_page != self.items_per_page:
             self.items_per_page = new_items_per_page
@@ -826,22 +1436,10 @@ class LoginDialog(QDialog):
     def setup_ui(self):
         self.setWindowTitle("VRChat Login")
         self.setFixedSize(400, 300)
-        
-        theme = app_theme["dark" if is_dark_mode else "light"]
-        
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {theme["background"]};
-                border-radius: 10px;
-            }}
-            QLabel {{
-                color: {theme["text"]};
-            }}
-            QCheckBox {{
-                color: {theme["text"]};
-            }}
-        """)
-        
+        self.setObjectName("loginDialog")  # Styled by the app-wide stylesheet
+
+        theme = _theme()
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(15)
@@ -873,20 +1471,7 @@ class LoginDialog(QDialog):
         # Remember me checkbox
         self.save_checkbox = QCheckBox("Remember my credentials")
         self.save_checkbox.setChecked(True)
-        self.save_checkbox.setStyleSheet(f"""
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 1px solid {theme["divider"]};
-                border-radius: 3px;
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {theme["primary"]};
-                border: 1px solid {theme["primary"]};
-                image: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><polyline points="20 6 9 17 4 12"></polyline></svg>');
-            }}
-        """)
-        
+
         # Login button with animation
         self.login_btn = AnimatedButton("Sign In", primary=True)
         self.login_btn.setFixedHeight(40)
@@ -934,30 +1519,21 @@ class TwoFactorDialog(QDialog):
     def setup_ui(self):
         self.setWindowTitle("Two-Factor Authentication")
         self.setFixedSize(400, 250)
-        
-        theme = app_theme["dark" if is_dark_mode else "light"]
-        
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {theme["background"]};
-                border-radius: 10px;
-            }}
-            QLabel {{
-                color: {theme["text"]};
-            }}
-        """)
-        
+        self.setObjectName("twoFactorDialog")  # Styled by the app-wide stylesheet
+
+        theme = _theme()
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(15)
-        
+
         # Determine title and message based on type
         title = "Email Verification" if self.is_email else "Authenticator Verification"
         source = "sent to your email" if self.is_email else "from your authenticator app"
         
         # Header
         self.title_label = QLabel(title)
-        self.title_label.setFont(QFont('Segoe UI', 18, QFont.Weight.Bold))
+        self.title_label.setFont(FONT_TITLE)
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.title_label.setStyleSheet(f"color: {theme['primary']};")
         
@@ -971,22 +1547,13 @@ class TwoFactorDialog(QDialog):
         self.code_input.setMaxLength(6)
         self.code_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.code_input.setFixedHeight(50)
-        self.code_input.setFont(QFont('Segoe UI', 24))
-        self.code_input.textChanged.connect(self.validate_code_input)
-        self.code_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {theme["surface"]};
-                color: {theme["text"]};
-                border: 1px solid {theme["divider"]};
-                border-radius: 8px;
-                padding: 8px;
-                letter-spacing: 10px;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid {theme["primary"]};
-            }}
-        """)
-        
+        self.code_input.setFont(FONT_CODE_BIG)
+        # Qt-side digit validation: no Python round-trip per keystroke and
+        # no setText re-entry into textChanged
+        self.code_input.setValidator(
+            QRegularExpressionValidator(QRegularExpression(r"\d{0,6}"), self.code_input))
+        self.code_input.setObjectName("twoFactorCode")
+
         # Verify button
         self.verify_btn = AnimatedButton("Verify", primary=True)
         self.verify_btn.setFixedHeight(40)
@@ -1002,12 +1569,6 @@ class TwoFactorDialog(QDialog):
         # Focus the input
         self.code_input.setFocus()
     
-    def validate_code_input(self, text):
-        # Only allow digits
-        filtered_text = ''.join(filter(str.isdigit, text))
-        if filtered_text != text:
-            self.code_input.setText(filtered_text)
-    
     def get_code(self):
         return self.code_input.text()
 
@@ -1023,37 +1584,111 @@ class VRChatManager(QMainWindow):
         self.last_scroll_pos = 0
         self.last_scroll_time = 0
         self.is_scrolling = False
+        # True while the scrollbar slider is grabbed; sliderReleased
+        # ends that gesture, so the trailing timer only backs up wheel
+        # and keyboard scrolling
+        self._slider_held = False
+        self.scroll_timer = QTimer(self)
+        self.scroll_timer.setSingleShot(True)
+        self.scroll_timer.timeout.connect(self.on_scroll_end)
+        self._lazy_avatars = []
+        self._lazy_created = 0
+        self._lazy_cols = 1
+        # Live cards in grid order; avoids itemAt() walks over the layout
+        self._avatar_cards = []
+        # Detached cards awaiting reuse; paging rebinds these via
+        # setAvatar instead of deleteLater + reconstruction
+        self._card_pool = []
+        # Small LRU of fetched collections keyed by filter type
+        self._avatar_cache = OrderedDict()
+        # Set by the Refresh button to force a real network fetch
+        self._skip_disk_cache = False
+        # Bumped on every fetch; in-flight first-page/backfill results
+        # from an older fetch compare against it and get dropped
+        self._fetch_generation = 0
+        # Lowercased search haystacks for avatars_data, rebuilt lazily;
+        # _search_blobs_src is the list they were built from, compared
+        # by identity so a new collection of the same length still
+        # invalidates (same trick as _last_render below)
+        self._search_blobs = []
+        self._search_blobs_src = None
+        # (list, page, items_per_page) of the last rendered page; lets
+        # display_current_page skip redundant rebuilds of the same view
+        self._last_render = None
+        # Grid column count derived from the viewport width; invalidated
+        # by resizeEvent and recomputed on the next display
+        self._cached_cols = None
         self.threadpool = QThreadPool()
+        # Event-loop driven file downloads; no threadpool slot is held
+        # for the duration of a transfer
+        self._nam = QNetworkAccessManager(self)
+        self._download_reply = None
+        self._download_fd = None
+        self._download_path = None
+        self._download_last_pct = -1
+        self._download_written = 0
+        self._download_total = 0
+        # Set when a local write fails mid-transfer (disk full); the
+        # finished handler reports it instead of the network error
+        self._download_write_error = None
+        # Progress is sampled at 20 Hz from this timer rather than on
+        # every downloadProgress callback the network stack fires
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._pump_download_progress)
         
         # Set the global theme to start
         global app_theme, is_dark_mode
         app_theme = THEME
         is_dark_mode = True  # Start with dark mode
         
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self.refresh_avatar_panels)
+
+        self._enable_updates_timer = QTimer(self)
+        self._enable_updates_timer.setSingleShot(True)
+        self._enable_updates_timer.timeout.connect(
+            lambda: self.avatar_container.setUpdatesEnabled(True))
+
         self.load_config()
+        _apply_global_qss()
         self.setup_ui()
         
     def load_config(self):
+        # Skip the re-parse entirely when the file is unchanged since the
+        # last successful load; the parsed values are still on self
+        if os.path.exists(CONFIG_FILE):
+            try:
+                if getattr(self, '_config_mtime', None) == os.path.getmtime(CONFIG_FILE):
+                    return
+            except OSError:
+                pass
+
         # Initialize config values
         self.vrchat_username = ""
         self.vrchat_password = ""
         self.dark_mode = True
-        
+
         # Load from config file if exists
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    self.vrchat_username = config.get("vrchat_username", "")
-                    self.vrchat_password = config.get("vrchat_password", "")
-                    self.dark_mode = config.get("dark_mode", True)
-                    
-                    # Set global dark mode
-                    global is_dark_mode
-                    is_dark_mode = self.dark_mode
+                mtime = os.path.getmtime(CONFIG_FILE)
+                with open(CONFIG_FILE, 'rb') as f:
+                    data = f.read()
+                config = orjson.loads(data) if orjson else json.loads(data)
+                self._config_mtime = mtime
+
+                self.vrchat_username = config.get("vrchat_username", "")
+                self.vrchat_password = config.get("vrchat_password", "")
+                self.dark_mode = config.get("dark_mode", True)
+
+                # Set global dark mode
+                global is_dark_mode
+                is_dark_mode = self.dark_mode
             except Exception as e:
                 logger.error(f"Error loading config: {e}")
-    
+
     def save_config(self, username="", password=""):
         try:
             config = {
@@ -1061,39 +1696,48 @@ class VRChatManager(QMainWindow):
                 "vrchat_password": password if password else self.vrchat_password,
                 "dark_mode": is_dark_mode
             }
-            
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=4)
+
+            if orjson:
+                payload = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(config, indent=4).encode('utf-8')
+            with open(CONFIG_FILE, 'wb') as f:
+                f.write(payload)
+            self._config_mtime = os.path.getmtime(CONFIG_FILE)
             logger.info("Config saved successfully")
         except Exception as e:
             logger.error(f"Error saving config: {e}")
             
     def debug_avatar_structure(self, avatar_data):
         """Print detailed debug information about an avatar's structure"""
-        logger.info(f"=== Debug Avatar Structure ===")
-        logger.info(f"Avatar name: {avatar_data.get('name', 'Unknown')}")
-        logger.info(f"Avatar ID: {avatar_data.get('id', 'Unknown')}")
-        logger.info(f"Top-level keys: {list(avatar_data.keys())}")
-        
+        # Skip all the formatting work when nothing would log it anyway
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        logger.info("=== Debug Avatar Structure ===")
+        logger.info("Avatar name: %s", avatar_data.get('name', 'Unknown'))
+        logger.info("Avatar ID: %s", avatar_data.get('id', 'Unknown'))
+        logger.info("Top-level keys: %s", list(avatar_data.keys()))
+
         # Check for direct assetUrl
         if 'assetUrl' in avatar_data:
-            logger.info(f"Direct assetUrl: {avatar_data['assetUrl']}")
+            logger.info("Direct assetUrl: %s", avatar_data['assetUrl'])
         else:
-            logger.info(f"No direct assetUrl found")
-        
+            logger.info("No direct assetUrl found")
+
         # Check for unityPackages
         if 'unityPackages' in avatar_data and avatar_data['unityPackages']:
-            logger.info(f"Unity packages count: {len(avatar_data['unityPackages'])}")
+            logger.info("Unity packages count: %d", len(avatar_data['unityPackages']))
             for i, pkg in enumerate(avatar_data['unityPackages']):
-                logger.info(f"  Package {i}:")
-                logger.info(f"    Keys: {list(pkg.keys())}")
+                logger.info("  Package %d:", i)
+                logger.info("    Keys: %s", list(pkg.keys()))
                 if 'assetUrl' in pkg:
-                    logger.info(f"    assetUrl: {pkg['assetUrl']}")
-                logger.info(f"    platform: {pkg.get('platform', 'unknown')}")
+                    logger.info("    assetUrl: %s", pkg['assetUrl'])
+                logger.info("    platform: %s", pkg.get('platform', 'unknown'))
         else:
-            logger.info(f"No unityPackages found")
-        
-        logger.info(f"=== End Debug ===")
+            logger.info("No unityPackages found")
+
+        logger.info("=== End Debug ===")
         
         
         
@@ -1101,7 +1745,7 @@ class VRChatManager(QMainWindow):
     def setup_scroll_optimization(self):
         """Apply aggressive anti-ghosting techniques for scrolling"""
         # Create a solid color background for the scrolling area
-        theme = app_theme["dark" if is_dark_mode else "light"]
+        theme = _theme()
         self.scroll_area.viewport().setStyleSheet(f"background-color: {theme['background']};")
         
         # Enable background auto-fill for the container and viewport
@@ -1119,11 +1763,12 @@ class VRChatManager(QMainWindow):
         # Connect to scroll events
         scrollbar = self.scroll_area.verticalScrollBar()
         scrollbar.valueChanged.connect(self.on_scroll_change)
+        scrollbar.valueChanged.connect(self._maybe_extend_grid)
         
-        # Create ghost-buster overlay
-        self.ghost_overlay = QWidget(self.scroll_area)
-        self.ghost_overlay.setStyleSheet(f"background-color: {theme['background']};")
-        self.ghost_overlay.hide()
+        # Timer that ends ghost-busting shortly after scrolling stops
+        self._scroll_end_timer = QTimer(self)
+        self._scroll_end_timer.setSingleShot(True)
+        self._scroll_end_timer.timeout.connect(self._end_fast_scroll)
         
         
     def on_scroll_change(self, value):
@@ -1137,9 +1782,12 @@ class VRChatManager(QMainWindow):
         # Calculate scroll speed
         current_time = QDateTime.currentMSecsSinceEpoch()
         time_diff = current_time - self.last_scroll_time
-        if time_diff < 1:  # Avoid division by zero
-            time_diff = 1
-        
+        if time_diff < 16:
+            # Throttle to roughly one frame; a fast wheel emits many more
+            # ticks than that and the skipped distance still counts toward
+            # the speed estimate on the next handled tick
+            return
+
         scroll_distance = abs(value - self.last_scroll_pos)
         scroll_speed = scroll_distance / time_diff
         
@@ -1147,20 +1795,20 @@ class VRChatManager(QMainWindow):
         self.last_scroll_pos = value
         self.last_scroll_time = current_time
         
-        # If scrolling quickly, use the ghost-buster
+        # If scrolling quickly, use the ghost-buster: suspend viewport
+        # painting until the wheel settles instead of stacking an opaque
+        # overlay widget over it
         if scroll_speed > 0.2:  # Threshold for "fast scrolling"
-            # Show ghost overlay during fast scrolling
-            self.ghost_overlay.setGeometry(self.scroll_area.viewport().rect())
-            self.ghost_overlay.show()
-            self.ghost_overlay.raise_()
-            
-            # Schedule to hide it shortly after scrolling stops
-            QTimer.singleShot(100, self.hide_ghost_overlay)
-        
-    def hide_ghost_overlay(self):
-        """Hide the ghost overlay after scrolling stops"""
-        if hasattr(self, 'ghost_overlay'):
-            self.ghost_overlay.hide()
+            self.scroll_area.viewport().setUpdatesEnabled(False)
+            # Restarting the member timer pushes the repaint back until
+            # 100 ms after the last fast tick
+            self._scroll_end_timer.start(100)
+
+    def _end_fast_scroll(self):
+        """Resume viewport painting once fast scrolling stops"""
+        viewport = self.scroll_area.viewport()
+        viewport.setUpdatesEnabled(True)
+        viewport.update()
 
 
     def fix_scroll_behavior(self):
@@ -1171,26 +1819,34 @@ class VRChatManager(QMainWindow):
         # Disable horizontal scrolling
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
-        # Make sure each card has a fixed size
-        for i in range(self.avatar_grid.count()):
-            item = self.avatar_grid.itemAt(i)
-            if item and item.widget():
-                item.widget().setFixedSize(300, 340)
+        # Make sure each card has a fixed size; suspend painting so the
+        # container does one layout pass instead of one per card. The
+        # card list sidesteps per-index itemAt()/widget() layout walks
+        self.avatar_container.setUpdatesEnabled(False)
+        try:
+            for card in self._avatar_cards:
+                card.setFixedSize(300, 340)
+        finally:
+            self.avatar_container.setUpdatesEnabled(True)
 
     def on_scroll(self, value):
         """Handle scroll events to prevent layout shifts"""
         # Temporarily disable layout updates during scrolling
         self.avatar_container.setUpdatesEnabled(False)
-        
-        # Re-enable updates after a short delay
-        QTimer.singleShot(50, lambda: self.avatar_container.setUpdatesEnabled(True))
+
+        # Re-enable after a short delay; restarting the member timer avoids
+        # allocating a QTimer plus a lambda closure on every tick
+        self._enable_updates_timer.start(50)
         
         
         
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        # Delay refresh to avoid excessive updates during resizing
-        QTimer.singleShot(200, self.refresh_avatar_panels)
+        # The viewport width changed, so the cached column count is stale
+        self._cached_cols = None
+        # Debounce: restarting the timer means only the last resize in a
+        # drag gesture triggers a refresh, not one per event
+        self._resize_timer.start(200)
         
     
     def setup_ui(self):
@@ -1214,7 +1870,7 @@ class VRChatManager(QMainWindow):
         logo_layout.setSpacing(10)
         
         self.logo_label = QLabel(APP_NAME)
-        self.logo_label.setFont(QFont('Segoe UI', 18, QFont.Weight.Bold))
+        self.logo_label.setFont(FONT_TITLE)
         
         logo_layout.addWidget(self.logo_label)
         
@@ -1289,11 +1945,16 @@ class VRChatManager(QMainWindow):
         
         # Search with nice animation
         self.search_input = AnimatedLineEdit(placeholder="Search avatars by name...")
-        self.search_input.textChanged.connect(self.filter_avatars)
+        # Debounce filtering so typing a word filters once, not per keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self.filter_avatars)
+        self.search_input.textChanged.connect(self._on_search_text_changed)
         
         # Refresh button
         self.refresh_btn = AnimatedButton("Refresh", primary=False)
-        self.refresh_btn.clicked.connect(self.fetch_avatars)
+        self.refresh_btn.clicked.connect(self.refresh_avatars)
         
         search_layout.addWidget(QLabel("Show:"))
         search_layout.addWidget(self.filter_combo)
@@ -1312,7 +1973,13 @@ class VRChatManager(QMainWindow):
         self.avatar_grid.setContentsMargins(10, 10, 10, 10)
         
         self.scroll_area.setWidget(self.avatar_container)
-        
+
+        # Hook up scroll handling now that the scroll area exists; the
+        # lazy grid depends on the valueChanged connection made here and
+        # the simplified scroll mode on the gesture connections
+        self.setup_scroll_optimization()
+        self.setup_anti_flicker()
+
         # Pagination controls
         self.pagination = PaginationWidget()
         self.pagination.pageChanged.connect(self.change_page)
@@ -1348,7 +2015,7 @@ class VRChatManager(QMainWindow):
         
         # Title
         downloader_title = QLabel("File Downloader")
-        downloader_title.setFont(QFont('Segoe UI', 18, QFont.Weight.Bold))
+        downloader_title.setFont(FONT_TITLE)
         downloader_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Input form
@@ -1381,7 +2048,7 @@ class VRChatManager(QMainWindow):
         self.download_btn = AnimatedButton("Download File", primary=True)
         self.download_btn.setFixedWidth(200)
         self.download_btn.setFixedHeight(50)
-        self.download_btn.setFont(QFont('Segoe UI', 12, QFont.Weight.Bold))
+        self.download_btn.setFont(FONT_BUTTON)
         self.download_btn.clicked.connect(self.download_file)
         
         # Status area
@@ -1421,7 +2088,7 @@ class VRChatManager(QMainWindow):
         log_controls = QHBoxLayout()
         
         log_title = QLabel("Application Logs")
-        log_title.setFont(QFont('Segoe UI', 14, QFont.Weight.Bold))
+        log_title.setFont(FONT_SUBTITLE)
         
         clear_log_btn = AnimatedButton("Clear Log", primary=False)
         clear_log_btn.clicked.connect(lambda: self.log_text.clear())
@@ -1434,10 +2101,12 @@ class VRChatManager(QMainWindow):
         log_controls.addWidget(clear_log_btn)
         log_controls.addWidget(save_log_btn)
         
-        # Log text area
-        self.log_text = QTextEdit()
+        # Log text area. QPlainTextEdit is built for append-only consoles:
+        # no rich-text layout per append, and the block cap bounds memory
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setFont(QFont('Consolas', 10))
+        self.log_text.setMaximumBlockCount(5000)
+        self.log_text.setFont(FONT_CODE)
         
         logs_layout.addLayout(log_controls)
         logs_layout.addWidget(self.log_text)
@@ -1457,11 +2126,11 @@ class VRChatManager(QMainWindow):
         
         # App info
         about_title = QLabel(APP_NAME)
-        about_title.setFont(QFont('Segoe UI', 24, QFont.Weight.Bold))
+        about_title.setFont(FONT_H1)
         about_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         about_version = QLabel(f"Version {APP_VERSION}")
-        about_version.setFont(QFont('Segoe UI', 14))
+        about_version.setFont(FONT_BODY)
         about_version.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Description with nice formatting
@@ -1507,10 +2176,36 @@ class VRChatManager(QMainWindow):
         QTimer.singleShot(500, self.check_login_status)
     
     def update_theme(self):
-        theme = app_theme["dark" if is_dark_mode else "light"]
-        
-        # Main window
-        self.setStyleSheet(f"""
+        # Both big sheets are built once per theme and reused on every
+        # toggle after the first
+        self.setStyleSheet(_cached_style(
+            ("VRChatManager", "window", _theme_key()), self._build_window_style))
+        self.header.setStyleSheet(_cached_style(
+            ("VRChatManager", "header", _theme_key()), self._build_header_style))
+
+        # Status indicator
+        if self.api_client:
+            self.status_icon.setStyleSheet("background-color: #4CAF50; border-radius: 6px;")
+        else:
+            self.status_icon.setStyleSheet("background-color: #ff5252; border-radius: 6px;")
+
+        # Update widgets with custom theme methods. Theme-aware widgets
+        # register themselves in _THEMED_WIDGETS at construction, so this
+        # walks a few dozen entries instead of findChildren over the whole
+        # widget tree (most of which has no theme hook to call).
+        for widget in list(_THEMED_WIDGETS):
+            try:
+                if hasattr(widget, 'setTheme'):
+                    widget.setTheme(is_dark_mode)
+                else:
+                    widget.update_theme()
+            except RuntimeError:
+                # C++ side already deleted; the WeakSet will drop it
+                _THEMED_WIDGETS.discard(widget)
+
+    def _build_window_style(self):
+        theme = _theme()
+        return f"""
             QMainWindow, QWidget {{
                 background-color: {theme["background"]};
                 color: {theme["text"]};
@@ -1595,7 +2290,7 @@ class VRChatManager(QMainWindow):
                 selection-background-color: {theme["primary"]};
                 selection-color: white;
             }}
-            QTextEdit {{
+            QTextEdit, QPlainTextEdit {{
                 background-color: {theme["surface"]};
                 color: {theme["text"]};
                 border: 1px solid {theme["divider"]};
@@ -1615,13 +2310,14 @@ class VRChatManager(QMainWindow):
                 padding: 0 5px;
                 color: {theme["text"]};
             }}
-        """)
-        
-        # Header styling
+        """
+
+    def _build_header_style(self):
+        theme = _theme()
         header_bg_start = theme["primary"]
-        header_bg_end = self._adjust_color(theme["primary"], -40 if is_dark_mode else 40)
-        
-        self.header.setStyleSheet(f"""
+        header_bg_end = _adjust_color(theme["primary"], -40 if is_dark_mode else 40)
+
+        return f"""
             QFrame {{
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
                                             stop:0 {header_bg_start}, 
@@ -1635,60 +2331,32 @@ class VRChatManager(QMainWindow):
                 color: white;
                 background: transparent;
             }}
-        """)
-        
-        # Status indicator
-        if self.api_client:
-            self.status_icon.setStyleSheet("background-color: #4CAF50; border-radius: 6px;")
-        else:
-            self.status_icon.setStyleSheet("background-color: #ff5252; border-radius: 6px;")
-        
-        # Update widgets that have custom theme methods
-        for widget in self.findChildren(QWidget):
-            if hasattr(widget, 'setTheme') and callable(getattr(widget, 'setTheme')):
-                widget.setTheme(is_dark_mode)
-            elif hasattr(widget, 'update_theme') and callable(getattr(widget, 'update_theme')):
-                widget.update_theme()
-    
-    def _adjust_color(self, color, amount):
-        # Convert hex to RGB
-        color = color.lstrip('#')
-        r, g, b = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
-        
-        # Adjust based on amount (positive = lighten, negative = darken)
-        if amount > 0:
-            r = min(255, r + amount)
-            g = min(255, g + amount)
-            b = min(255, b + amount)
-        else:
-            r = max(0, r + amount)
-            g = max(0, g + amount)
-            b = max(0, b + amount)
-        
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
-    
+        """
+
     def toggle_theme(self, is_dark):
         global is_dark_mode
         is_dark_mode = is_dark
-        
+
         # Update the UI
+        _apply_global_qss()
         self.update_theme()
         
         # Save the setting
         self.save_config()
         
-        # Add a simple animation for theme transition
-        fade = QGraphicsOpacityEffect(self.centralWidget())
-        self.centralWidget().setGraphicsEffect(fade)
-        
-        # Fade out/in animation for smooth transition
-        anim = QPropertyAnimation(fade, b"opacity")
-        anim.setDuration(300)
-        anim.setStartValue(0.7)
-        anim.setEndValue(1.0)
-        anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        anim.start()
+        # Add a simple animation for theme transition. Animating
+        # windowOpacity goes through the platform compositor; the old
+        # QGraphicsOpacityEffect on centralWidget() forced the entire
+        # subtree through the raster fallback for the whole fade. One
+        # reusable animation, restarted per toggle.
+        if not hasattr(self, '_theme_fade'):
+            self._theme_fade = QPropertyAnimation(self, b"windowOpacity")
+            self._theme_fade.setDuration(300)
+            self._theme_fade.setStartValue(0.7)
+            self._theme_fade.setEndValue(1.0)
+            self._theme_fade.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._theme_fade.stop()
+        self._theme_fade.start()
     
     def save_log(self):
         file_path, _ = QFileDialog.getSaveFileName(
@@ -1727,7 +2395,7 @@ class VRChatManager(QMainWindow):
             
             # Show login in progress
             self.status_label.setText("Logging in...")
-            theme = app_theme["dark" if is_dark_mode else "light"]
+            theme = _theme()
             self.status_label.setStyleSheet(f"color: white; font-weight: bold;")
             self.login_btn.setEnabled(False)
             
@@ -1807,11 +2475,12 @@ class VRChatManager(QMainWindow):
     def handle_login_result(self, result):
         self.login_btn.setEnabled(True)
         self.avatars_progress.setVisible(False)
-        theme = app_theme["dark" if is_dark_mode else "light"]
+        theme = _theme()
         
         if result["success"]:
             # Login successful
             self.api_client = result["api_client"]
+            image_fetcher().set_api_client(self.api_client)
             user = result["user"]
             
             # Update status
@@ -1823,15 +2492,18 @@ class VRChatManager(QMainWindow):
             self.avatars_status.setText("Ready to browse avatars")
             self.login_btn.setText("Switch User")
             
-            # Fade in animation for status
-            anim = QGraphicsOpacityEffect(self.status_label)
-            self.status_label.setGraphicsEffect(anim)
-            
-            fade_anim = QPropertyAnimation(anim, b"opacity")
-            fade_anim.setDuration(500)
-            fade_anim.setStartValue(0.5)
-            fade_anim.setEndValue(1.0)
-            fade_anim.start()
+            # Fade in animation for status; the effect only covers the
+            # small status label and both objects are allocated once and
+            # restarted on later logins
+            if not hasattr(self, '_status_fade'):
+                effect = QGraphicsOpacityEffect(self.status_label)
+                self.status_label.setGraphicsEffect(effect)
+                self._status_fade = QPropertyAnimation(effect, b"opacity")
+                self._status_fade.setDuration(500)
+                self._status_fade.setStartValue(0.5)
+                self._status_fade.setEndValue(1.0)
+            self._status_fade.stop()
+            self._status_fade.start()
             
             # Fetch avatars automatically
             self.fetch_avatars()
@@ -1903,6 +2575,7 @@ class VRChatManager(QMainWindow):
         if result["success"]:
             # 2FA successful
             self.api_client = self.temp_api_client
+            image_fetcher().set_api_client(self.api_client)
             user = result["user"]
             
             # Update status
@@ -1948,42 +2621,55 @@ class VRChatManager(QMainWindow):
         # Determine filter type
         filter_index = self.filter_combo.currentIndex()
         filter_type = ["all", "Public Avatars", "Private Avatars"][min(filter_index, 2)]
-        
-        # Fetch avatars in background
-        worker = Worker(self.fetch_avatars_worker, filter_type)
-        worker.signals.result.connect(self.handle_avatars_result)
+
+        # Retire any fetch/backfill still in flight for a previous view
+        self._fetch_generation += 1
+        generation = self._fetch_generation
+
+        # Serve a recently fetched collection straight from the cache so
+        # switching filters back and forth skips the network entirely
+        cached = self._avatar_cache.get(filter_type)
+        if cached is not None:
+            self._avatar_cache.move_to_end(filter_type)
+            self.avatars_progress.setVisible(False)
+            self.handle_avatars_result(cached)
+            return
+
+        # Then the short-TTL disk cache, so re-opening the app (or coming
+        # back within a few minutes) skips the catalog walk too
+        if not self._skip_disk_cache:
+            cached = self._read_avatar_disk_cache(filter_type)
+            if cached is not None:
+                self._store_avatar_cache(filter_type, cached)
+                self.avatars_progress.setVisible(False)
+                self.handle_avatars_result(cached)
+                return
+        self._skip_disk_cache = False
+
+        # Fetch just the first page server-side (n/offset) so something is
+        # on screen after one round-trip; the rest backfills in background
+        worker = Worker(self.fetch_avatars_worker, filter_type,
+                        page_size=self.pagination.items_per_page, max_pages=1)
+        worker.signals.result.connect(partial(self.handle_first_page_result, filter_type, generation))
         worker.signals.error.connect(self.handle_avatars_error)
         self.threadpool.start(worker)
-    
-    def fetch_avatars_worker(self, filter_type):
+
+    def fetch_avatars_worker(self, filter_type, offset=0, page_size=100, max_pages=10):
         try:
-            # We'll use direct requests instead of the SDK
-            # Get authentication cookies from the API client
-            cookies = {}
-            if self.api_client:
-                for cookie in self.api_client.rest_client.cookie_jar:
-                    cookies[cookie.name] = cookie.value
-            
-            # Set up headers
-            headers = {
-                "User-Agent": self.api_client.user_agent,
-                "Accept": "application/json"
-            }
-            
-            all_avatars = []
-            offset = 0
-            page_size = 100  # Fetch more at once for efficiency
+            # We'll use direct requests instead of the SDK; the cookie
+            # dict and headers are cached on the client so parallel page
+            # fetches don't re-iterate the jar
+            cookies = _cookies_for(self.api_client)
+            headers = _headers_for(self.api_client)
             
-            # Loop to fetch multiple pages
-            max_pages = 10
-            for page in range(max_pages):
+            def fetch_page(page_offset):
                 # Set parameters based on filter type
                 params = {
                     "n": page_size,
-                    "offset": offset,
+                    "offset": page_offset,
                     "releaseStatus": "all"
                 }
-                
+
                 if filter_type == "Private Avatars":
                     params["releaseStatus"] = "private"
                     params["sort"] = "updated"
@@ -1995,42 +2681,60 @@ class VRChatManager(QMainWindow):
                 else:
                     # Default for "all avatars"
                     params["releaseStatus"] = "all"
-                
-                # Make direct API call to VRChat
-                logger.info(f"Fetching avatars page {page+1} with params: {params}")
-                response = requests.get(
+
+                # Direct API call through the pooled session: keep-alive
+                # amortizes the TCP+TLS handshake across pages
+                logger.info("Fetching avatars at offset %s with params: %s", page_offset, params)
+                response = _HTTP.get(
                     "https://api.vrchat.cloud/api/1/avatars",
                     params=params,
                     headers=headers,
                     cookies=cookies
                 )
-                
+
                 if response.status_code != 200:
+                    if response.status_code == 401:
+                        _invalidate_cookies(self.api_client)
                     logger.error(f"API error: {response.status_code} - {response.text[:200]}")
                     raise Exception(f"API error: {response.status_code}")
-                
-                # Parse JSON response
-                avatars = response.json()
-                
-                # Log response
-                logger.info(f"Received {len(avatars)} avatars in page {page+1}")
-                
-                # Check if we got any results
-                if not avatars:
-                    logger.info(f"No more avatars found on page {page+1}, stopping pagination")
-                    break
-                
-                # Add to collection
-                all_avatars.extend(avatars)
-                
-                # Break if we got fewer results than requested (last page)
-                if len(avatars) < page_size:
-                    logger.info(f"Received fewer than {page_size} avatars, this is the last page")
-                    break
-                
-                # Update offset for next page
-                offset += page_size
-            
+
+                if orjson:
+                    raw = orjson.loads(response.content)
+                else:
+                    raw = response.json()
+
+                # Keep only the fields the cards and the search filter
+                # actually read. The full payload carries tag lists and
+                # unity package metadata per avatar that would otherwise
+                # sit in memory (and in the disk cache) unused; downloads
+                # re-fetch the detailed record by id anyway. The search
+                # haystack is lowercased here on the worker thread so the
+                # GUI-side filter index is a plain key lookup.
+                slim = []
+                for a in raw:
+                    rec = {k: a.get(k) for k in _AVATAR_FIELDS}
+                    rec["searchBlob"] = (
+                        f"{rec['name'] or ''}\n{rec['authorName'] or ''}\n"
+                        f"{rec['description'] or ''}"
+                    ).lower()
+                    slim.append(rec)
+                return slim
+
+            # First page synchronously: it tells us whether more exist
+            all_avatars = list(fetch_page(offset))
+            if max_pages > 1 and len(all_avatars) >= page_size:
+                # Fetch the remaining pages concurrently (modest worker
+                # count to stay friendly with VRChat's rate limits) and
+                # stitch them back together in page order
+                offsets = [offset + i * page_size for i in range(1, max_pages)]
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    for avatars in pool.map(fetch_page, offsets):
+                        if not avatars:
+                            break
+                        all_avatars.extend(avatars)
+                        if len(avatars) < page_size:
+                            break
+
             logger.info(f"Fetched a total of {len(all_avatars)} avatars")
             return all_avatars
             
@@ -2060,19 +2764,47 @@ class VRChatManager(QMainWindow):
         self.avatars_status.setText(f"Error: {error}")
         QMessageBox.critical(self, "Avatar Fetch Error", str(error))
     
+    def _on_search_text_changed(self, text):
+        # Typing is debounced; clearing the box resets the view at once
+        if text:
+            self._search_timer.start()
+        else:
+            self._search_timer.stop()
+            self.filter_avatars()
+
+    def _rebuild_filter_index(self):
+        """Collect one lowercase haystack per avatar for filtering.
+
+        Fresh fetches arrive with the blob precomputed on the worker
+        thread; the fallback covers disk caches written before the field
+        existed.
+        """
+        self._search_blobs = [
+            a.get('searchBlob') or
+            f"{a.get('name') or ''}\n{a.get('authorName') or ''}\n{a.get('description') or ''}".lower()
+            for a in self.avatars_data
+        ]
+        self._search_blobs_src = self.avatars_data
+
     def filter_avatars(self):
         # Get filter text
         filter_text = self.search_input.text().lower()
-        
+
         # Filter avatars from the ENTIRE dataset
         if filter_text:
-            self.filtered_avatars = []
-            for avatar in self.avatars_data:  # Use full dataset
-                if (filter_text in avatar.get('name', '').lower() or 
-                    filter_text in avatar.get('authorName', '').lower() or 
-                    filter_text in avatar.get('description', '').lower()):
-                    self.filtered_avatars.append(avatar)
-            
+            # Lowercasing happens once per fetch, not once per keystroke
+            # per avatar; each scan step is a single C-level substring
+            # check against the combined name/author/description blob
+            if self._search_blobs_src is not self.avatars_data:
+                self._rebuild_filter_index()
+
+            data = self.avatars_data
+            blobs = self._search_blobs
+            self.filtered_avatars = [
+                data[i] for i in range(len(data))
+                if filter_text in blobs[i]
+            ]
+
             # Update status
             self.avatars_status.setText(
                 f"Found {len(self.filtered_avatars)} of {len(self.avatars_data)} avatars matching '{filter_text}'"
@@ -2127,29 +2859,27 @@ class VRChatManager(QMainWindow):
         # Temporarily suspend layout updates
         self.avatar_container.setUpdatesEnabled(False)
         
+        # The opaque card style is identical for every card on the page;
+        # build it once per theme and hand all cards the same string
+        card_qss = _cached_style(
+            ("AvatarCard", "anti_ghost", _theme_key()), self._build_opaque_card_style)
+
         # Create cards with anti-ghosting properties
         for i, avatar in enumerate(avatars):
             row = i // cols
             col = i % cols
-            
+
             # Create the card with ghost-resistant settings
             card = AvatarCard(avatar, self.api_client)
             card.downloadRequested.connect(self.download_avatar)
             card.setFixedSize(300, 340)
-            
+
             # Anti-ghost settings
             card.setAutoFillBackground(True)
-            
+
             # The crucial part: add each card as a completely opaque entity
-            theme = app_theme["dark" if is_dark_mode else "light"]
-            card.setStyleSheet(f"""
-                AvatarCard {{
-                    background-color: {theme["card"]};
-                    border-radius: 12px;
-                    border: 1px solid {theme["divider"]};
-                }}
-            """)
-            
+            card.setStyleSheet(card_qss)
+
             # Add to grid
             self.avatar_grid.addWidget(card, row, col)
         
@@ -2158,44 +2888,82 @@ class VRChatManager(QMainWindow):
         
     
 
+    @staticmethod
+    def _build_opaque_card_style():
+        theme = _theme()
+        return f"""
+            AvatarCard {{
+                background-color: {theme["card"]};
+                border-radius: 12px;
+                border: 1px solid {theme["divider"]};
+            }}
+        """
+
     def display_current_page(self):
         """Display the current page of avatars with simpler approach"""
+        # Skip the rebuild when the exact same view is already on screen
+        # (identity check on the list: filtering and fetching always
+        # produce a fresh list object, so same object means same data)
+        last = self._last_render
+        if (last is not None and last[0] is self.filtered_avatars
+                and last[1] == self.current_page
+                and last[2] == self.items_per_page):
+            return
+        self._last_render = (self.filtered_avatars, self.current_page,
+                             self.items_per_page)
+
         # Clear current grid using reliable technique
         self.clear_avatar_grid()
-        
+
         # Get avatars for current page
+        total = len(self.filtered_avatars)
         start_idx = (self.current_page - 1) * self.items_per_page
-        end_idx = min(start_idx + self.items_per_page, len(self.filtered_avatars))
+        end_idx = min(start_idx + self.items_per_page, total)
         current_page_avatars = self.filtered_avatars[start_idx:end_idx]
-        
+
         # Update status text
-        if self.filtered_avatars:
+        if total:
             self.avatars_status.setText(
-                f"Showing avatars {start_idx+1}-{end_idx} of {len(self.filtered_avatars)}"
+                f"Showing avatars {start_idx+1}-{end_idx} of {total}"
             )
         else:
             self.avatars_status.setText("No avatars found matching your search")
         
         # Use simpler display function that we know works
         self.display_avatars(current_page_avatars)
-    
+
+        # Warm the cache for the following page so clicking Next is instant
+        self.prefetch_next_page(end_idx)
+
+    def prefetch_next_page(self, start_idx):
+        """Prefetch thumbnails for the page starting at start_idx"""
+        next_end = min(start_idx + self.items_per_page, len(self.filtered_avatars))
+        if start_idx >= next_end:
+            return
+        urls = [avatar.get('thumbnailImageUrl') or avatar.get('imageUrl')
+                for avatar in self.filtered_avatars[start_idx:next_end]]
+        image_fetcher().prefetch(urls)
+
     def clear_avatar_grid(self):
-        """Completely remove all widgets from the grid"""
-        # Process any pending events first
-        QApplication.processEvents()
-        
-        # Clear the grid layout
-        while self.avatar_grid.count():
-            item = self.avatar_grid.takeAt(0)
-            if item and item.widget():
-                widget = item.widget()
-                # Remove any effects
-                widget.setGraphicsEffect(None)
-                # Delete the widget
-                widget.deleteLater()
-        
-        # Process delete events immediately
-        QApplication.processEvents()
+        """Detach all cards from the grid and park them in the pool"""
+        # Drop any cards not yet materialized by the lazy builder
+        self._lazy_avatars = []
+        self._lazy_created = 0
+
+        # Detach the cards for reuse instead of deleting them; the next
+        # page rebinds them through setAvatar. The live-card list already
+        # names every grid occupant, so this avoids the takeAt(0) walk
+        # that re-indexed the layout on each removal.
+        for card in self._avatar_cards:
+            self.avatar_grid.removeWidget(card)
+            card.hide()
+            self._card_pool.append(card)
+        self._avatar_cards = []
+
+        # Keep the pool sized to one page; shrinking items-per-page would
+        # otherwise strand the surplus cards (and their pixmaps) forever
+        while len(self._card_pool) > self.items_per_page:
+            self._card_pool.pop().deleteLater()
                 
     def showEvent(self, event):
         """Handle window show event"""
@@ -2216,80 +2984,75 @@ class VRChatManager(QMainWindow):
         self.avatar_container.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
         self.avatar_container.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
         
-        # Connect to scroll events
+        # Connect to scroll events. Slider drags have real gesture
+        # boundaries, so use them directly; valueChanged only backs up
+        # wheel/keyboard scrolling, which has no press/release.
         scrollbar = self.scroll_area.verticalScrollBar()
+        scrollbar.sliderPressed.connect(self._on_slider_pressed)
+        scrollbar.sliderReleased.connect(self._on_slider_released)
         scrollbar.valueChanged.connect(self.on_scroll_start)
-        
-        # Store state for scroll optimization 
-        self.is_scrolling = False
-        self.scroll_timer = QTimer(self)
-        self.scroll_timer.setSingleShot(True)
-        self.scroll_timer.timeout.connect(self.on_scroll_end)
+
+    def _on_slider_pressed(self):
+        self._slider_held = True
+        self._enter_scroll_mode()
+
+    def _on_slider_released(self):
+        self._slider_held = False
+        self._exit_scroll_mode()
 
     def on_scroll_start(self, value):
         """Optimize rendering during active scrolling"""
-        # Set scrolling state
-        self.is_scrolling = True
-        
-        # Reset timer on each scroll event
-        if hasattr(self, 'scroll_timer'):
-            self.scroll_timer.stop()
-            self.scroll_timer.start(200)
-        
-        # Temporarily reduce rendering quality during scrolling
-        # Instead of removing effects, we'll reduce card details
-        if not self.avatar_container.property("simplifiedForScrolling"):
-            self.avatar_container.setProperty("simplifiedForScrolling", True)
-            
-            # Apply simplified rendering to visible cards
-            for i in range(self.avatar_grid.count()):
-                item = self.avatar_grid.itemAt(i)
-                if item and item.widget():
-                    card = item.widget()
-                    # Apply a simpler style during scrolling
-                    card.setStyleSheet(card.styleSheet() + "\nbackground-color: rgba(45, 45, 68, 1.0);")
-                    # Just hide fancy elements instead of removing effects
-                    if hasattr(card, 'setScrollingMode'):
-                        card.setScrollingMode(True)
+        # While the slider is held, sliderReleased marks the end of the
+        # gesture; skip the trailing timer so each drag tick is free
+        if self._slider_held:
+            return
+
+        # Wheel scrolling has no release event; detect the end of the
+        # gesture with a trailing single-shot (start() restarts it)
+        self.scroll_timer.start(200)
+        self._enter_scroll_mode()
 
     def on_scroll_end(self):
         """Restore full rendering quality after scrolling stops"""
+        self._exit_scroll_mode()
+
+    def _enter_scroll_mode(self):
+        # Enter simplified rendering exactly once per scroll gesture, not
+        # on every valueChanged tick
+        if self.is_scrolling:
+            return
+        self.is_scrolling = True
+
+        # Flip the dynamic property the cards' cached stylesheet already
+        # scopes on; repolish is far cheaper than re-parsing appended CSS
+        for card in self._avatar_cards:
+            card.setProperty("scrolling", True)
+            card.style().unpolish(card)
+            card.style().polish(card)
+            card.setScrollingMode(True)
+
+    def _exit_scroll_mode(self):
+        if not self.is_scrolling:
+            return
         self.is_scrolling = False
-        
-        # Restore normal rendering
-        if self.avatar_container.property("simplifiedForScrolling"):
-            self.avatar_container.setProperty("simplifiedForScrolling", False)
-            
-            # Restore normal appearance
-            for i in range(self.avatar_grid.count()):
-                item = self.avatar_grid.itemAt(i)
-                if item and item.widget():
-                    card = item.widget()
-                    # Update style
-                    theme = app_theme["dark" if is_dark_mode else "light"]
-                    card.setStyleSheet(f"""
-                        AvatarCard {{
-                            background-color: {theme["card"]};
-                            border-radius: 12px;
-                            border: 1px solid {theme["divider"]};
-                        }}
-                        QLabel {{
-                            background-color: transparent;
-                            color: {theme["text"]};
-                        }}
-                    """)
-                    # Restore fancy elements
-                    if hasattr(card, 'setScrollingMode'):
-                        card.setScrollingMode(False)
+
+        for card in self._avatar_cards:
+            card.setProperty("scrolling", False)
+            card.style().unpolish(card)
+            card.style().polish(card)
+            card.setScrollingMode(False)
         
                 
     
     def display_avatars(self, avatars):
-        # Calculate columns based on available width
-        container_width = self.scroll_area.viewport().width() - 30
-        
-        # Use a fixed number of columns for consistency
-        cols = max(3, min(4, container_width // 340))
+        # Column count only depends on the viewport width, which is
+        # stable between page flips; recompute it lazily after resizes
+        cols = self._cached_cols
+        if cols is None:
+            container_width = self.scroll_area.viewport().width() - 30
+            # Use a fixed number of columns for consistency
+            cols = max(3, min(4, container_width // 340))
+            self._cached_cols = cols
         
         # Calculate total height required
         rows = (len(avatars) + cols - 1) // cols  # Ceiling division
@@ -2297,21 +3060,58 @@ class VRChatManager(QMainWindow):
         
         # Set container height
         self.avatar_container.setMinimumHeight(total_height)
-        
-        # Display avatars in grid
-        for i, avatar in enumerate(avatars):
-            row = i // cols
-            col = i % cols
-            
-            card = AvatarCard(avatar, self.api_client)
-            card.downloadRequested.connect(self.download_avatar)
-            card.setFixedSize(300, 340)
-            
-            # Add to grid
-            self.avatar_grid.addWidget(card, row, col)
-        
+
+        # Lazily build cards: only what fills the viewport (plus one
+        # overscan row) is created up front; scrolling materializes the
+        # rest. Keeps page swaps cheap even at 100 items per page.
+        self._lazy_avatars = list(avatars)
+        self._lazy_created = 0
+        self._lazy_cols = cols
+
+        visible_rows = (self.scroll_area.viewport().height() + 359) // 360
+        self._create_cards_upto((visible_rows + 1) * cols)
+
         # Apply scroll behavior fixes but nothing else
         QTimer.singleShot(100, self.fix_scroll_behavior)
+
+    def _create_cards_upto(self, count):
+        """Create avatar cards up to index count, continuing where we left off"""
+        count = min(count, len(self._lazy_avatars))
+        if count <= self._lazy_created:
+            return
+        cols = self._lazy_cols
+        # One layout/paint pass for the whole batch of insertions
+        self.avatar_container.setUpdatesEnabled(False)
+        try:
+            for i in range(self._lazy_created, count):
+                avatar = self._lazy_avatars[i]
+                if self._card_pool:
+                    # Rebind a pooled card: no widget construction or
+                    # stylesheet application, just new texts and image
+                    card = self._card_pool.pop()
+                    card.api_client = self.api_client
+                    card.setAvatar(avatar)
+                else:
+                    card = AvatarCard(avatar, self.api_client)
+                    card.downloadRequested.connect(self.download_avatar)
+                    card.setFixedSize(300, 340)
+                self.avatar_grid.addWidget(card, i // cols, i % cols)
+                card.show()
+                self._avatar_cards.append(card)
+            # Settle the geometry for the whole batch in one layout pass
+            # before painting resumes, instead of one pass per addWidget
+            self.avatar_grid.activate()
+        finally:
+            self.avatar_container.setUpdatesEnabled(True)
+        self._lazy_created = count
+
+    def _maybe_extend_grid(self, value):
+        """Materialize more cards as the viewport approaches unbuilt rows"""
+        if self._lazy_created >= len(self._lazy_avatars):
+            return
+        bottom = value + self.scroll_area.viewport().height()
+        needed_rows = (bottom // 360) + 2  # two rows of overscan
+        self._create_cards_upto(needed_rows * self._lazy_cols)
     
     def download_avatar(self, avatar_data):
         """Download an avatar based on the avatar data"""
@@ -2353,42 +3153,45 @@ class VRChatManager(QMainWindow):
         # Now use the detailed avatar data which contains download URLs
         avatar_data = detailed_avatar
         
-        # Debug info
-        logger.info(f"Got detailed avatar data with keys: {list(avatar_data.keys())}")
+        # Debug info; the key listing is only built when it would be kept
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Got detailed avatar data with keys: {list(avatar_data.keys())}")
         
         # Find the best download URL
         download_url = None
         file_ext = ".vrca"  # Default to .vrca as requested
         
-        # Check unityPackages array (this is where most download URLs are)
+        # Check unityPackages array (this is where most download URLs are).
+        # Single pass: prefer a standalonewindows package with an assetUrl,
+        # fall back to any package with one.
         if 'unityPackages' in avatar_data and avatar_data['unityPackages']:
             packages = avatar_data['unityPackages']
             logger.info(f"Found {len(packages)} unity packages")
-            
+
             # Log all available platforms for debugging
-            platforms = [pkg.get('platform', 'unknown') for pkg in packages]
-            logger.info(f"Available platforms: {platforms}")
-            
-            # PRIORITY 1: Look specifically for standalonewindows platform
-            windows_packages = [pkg for pkg in packages if pkg.get('platform') == 'standalonewindows']
-            if windows_packages:
-                windows_pkg = windows_packages[0]
-                if 'assetUrl' in windows_pkg and windows_pkg['assetUrl']:
-                    download_url = windows_pkg['assetUrl']
+            if logger.isEnabledFor(logging.DEBUG):
+                platforms = [pkg.get('platform', 'unknown') for pkg in packages]
+                logger.debug(f"Available platforms: {platforms}")
+
+            fallback_url = None
+            fallback_platform = None
+            for pkg in packages:
+                asset_url = pkg.get('assetUrl')
+                if not asset_url:
+                    continue
+                if pkg.get('platform') == 'standalonewindows':
+                    download_url = asset_url
                     logger.info(f"Found standalonewindows package URL: {download_url}")
-                else:
-                    logger.info("Windows package found but no assetUrl available")
+                    break
+                if fallback_url is None:
+                    fallback_url = asset_url
+                    fallback_platform = pkg.get('platform', 'unknown')
             else:
-                logger.info("No standalonewindows platform package found")
-                
-            # PRIORITY 2: If still no URL, check any package with an assetUrl
-            if not download_url:
-                for package in packages:
-                    if 'assetUrl' in package and package['assetUrl']:
-                        platform = package.get('platform', 'unknown')
-                        download_url = package['assetUrl']
-                        logger.info(f"Using {platform} package URL as fallback: {download_url}")
-                        break
+                if fallback_url:
+                    download_url = fallback_url
+                    logger.info(f"Using {fallback_platform} package URL as fallback: {download_url}")
+                else:
+                    logger.info("No unity package with an assetUrl found")
         else:
             logger.info("No unityPackages found in avatar data")
         
@@ -2413,7 +3216,7 @@ class VRChatManager(QMainWindow):
             logger.info(f"Fixed URL by removing variant/security: {download_url}")
         
         # Sanitize avatar name for filename
-        safe_name = re.sub(r'[\\/:*?"<>|]', '_', avatar_data.get('name', 'avatar'))
+        safe_name = _SAFE_NAME_RE.sub('_', avatar_data.get('name', 'avatar'))
         default_filename = f"{safe_name}{file_ext}"
         
         # Ask user where to save the file
@@ -2449,32 +3252,36 @@ class VRChatManager(QMainWindow):
             logger.error("Not logged in")
             return None
         
-        # Get authentication cookies
-        cookies = {}
-        for cookie in self.api_client.rest_client.cookie_jar:
-            cookies[cookie.name] = cookie.value
-        
-        headers = {
-            "User-Agent": self.api_client.user_agent,
-            "Accept": "application/json"
-        }
-        
+        # Cached auth state; see _cookies_for/_headers_for
+        cookies = _cookies_for(self.api_client)
+        headers = _headers_for(self.api_client)
+
         # Make direct API call to get detailed avatar info
         url = f"https://api.vrchat.cloud/api/1/avatars/{avatar_id}"
         logger.info(f"Making API request to: {url}")
-        
+
         try:
-            response = requests.get(
+            # Pooled session: the keep-alive socket from the list fetch
+            # saves a TCP+TLS handshake on every avatar click
+            response = _HTTP.get(
                 url,
                 headers=headers,
-                cookies=cookies
+                cookies=cookies,
+                timeout=(5, 30)
             )
             
             if response.status_code == 200:
-                avatar_data = response.json()
+                # C-level parse when orjson is installed; detailed avatar
+                # payloads run to tens of KB of unityPackages metadata
+                if orjson:
+                    avatar_data = orjson.loads(response.content)
+                else:
+                    avatar_data = response.json()
                 logger.info(f"Successfully fetched detailed avatar data")
                 return avatar_data
             else:
+                if response.status_code == 401:
+                    _invalidate_cookies(self.api_client)
                 logger.error(f"Failed to fetch avatar details: {response.status_code}")
                 logger.error(f"Response: {response.text[:200]}")
                 return None
@@ -2507,11 +3314,105 @@ class VRChatManager(QMainWindow):
         
         # Apply any current filter
         self.filter_avatars()
-        
+
         # Add a slight delay before refreshing to ensure layout is ready
         QTimer.singleShot(300, self.refresh_avatar_panels)
-            
-            
+
+    def handle_first_page_result(self, filter_type, generation, avatars):
+        # A newer fetch (filter change, refresh) has superseded this one
+        if generation != self._fetch_generation:
+            return
+
+        # Show the first server-side page immediately
+        self.handle_avatars_result(avatars)
+        self._store_avatar_cache(filter_type, avatars)
+
+        # A full first page means there may be more; backfill the rest so
+        # search/filtering still covers the whole collection
+        if len(avatars) >= self.pagination.items_per_page:
+            worker = Worker(self.fetch_avatars_worker, filter_type, offset=len(avatars))
+            worker.signals.result.connect(
+                partial(self.handle_backfill_result, filter_type, generation, avatars))
+            worker.signals.error.connect(self.handle_backfill_error)
+            self.threadpool.start(worker)
+        else:
+            # Already complete; persist it for the next launch
+            self._write_avatar_disk_cache(filter_type, avatars)
+
+    def handle_backfill_result(self, filter_type, generation, first_page, avatars):
+        # Don't merge a stale backfill into a newer collection. The
+        # first page was cached optimistically before this backfill ran;
+        # evict it (identity check, in case a newer fetch has already
+        # cached its own entry) so it isn't served later as complete
+        if generation != self._fetch_generation:
+            if self._avatar_cache.get(filter_type) is first_page:
+                self._avatar_cache.pop(filter_type, None)
+            return
+        if not avatars:
+            self._write_avatar_disk_cache(filter_type, self.avatars_data)
+            return
+        self.avatars_data = self.avatars_data + avatars
+        self._store_avatar_cache(filter_type, self.avatars_data)
+        self._write_avatar_disk_cache(filter_type, self.avatars_data)
+
+        if self.search_input.text():
+            # Re-run the active search over the now-complete collection
+            self.filter_avatars()
+        else:
+            # Extend pagination in place without yanking the user back to page 1
+            self.filtered_avatars = self.avatars_data
+            self.pagination.set_page_count(len(self.filtered_avatars))
+            self.pagination.update_ui()
+            self.avatars_status.setText(f"Showing all {len(self.avatars_data)} avatars")
+
+    def handle_backfill_error(self, error):
+        # The first page is already on screen; just note the failure
+        logger.error(f"Error backfilling avatar list: {error}")
+        self.avatars_status.setText(f"Showing first {len(self.avatars_data)} avatars (fetch incomplete)")
+
+    def _store_avatar_cache(self, filter_type, avatars):
+        """Remember a fetched collection, evicting the oldest beyond four"""
+        self._avatar_cache[filter_type] = avatars
+        self._avatar_cache.move_to_end(filter_type)
+        while len(self._avatar_cache) > 4:
+            self._avatar_cache.popitem(last=False)
+
+    def _avatar_disk_cache_path(self, filter_type):
+        user_key = hashlib.sha1(
+            f"{self.vrchat_username}:{filter_type}".encode('utf-8')).hexdigest()
+        return os.path.join(CACHE_FOLDER, f"avatars_{user_key}.json")
+
+    def _read_avatar_disk_cache(self, filter_type, ttl=300):
+        """Return the cached collection if younger than ttl seconds"""
+        path = self._avatar_disk_cache_path(filter_type)
+        try:
+            if os.path.isfile(path) and time.time() - os.path.getmtime(path) < ttl:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                return orjson.loads(data) if orjson else json.loads(data)
+        except Exception as e:
+            logger.warning(f"Could not read avatar cache: {e}")
+        return None
+
+    def _write_avatar_disk_cache(self, filter_type, avatars):
+        """Persist a complete collection atomically for quick reloads"""
+        path = self._avatar_disk_cache_path(filter_type)
+        try:
+            payload = orjson.dumps(avatars) if orjson else json.dumps(avatars).encode('utf-8')
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write avatar cache: {e}")
+
+    def refresh_avatars(self):
+        """Force a network re-fetch, bypassing the collection caches"""
+        self._avatar_cache.clear()
+        self._skip_disk_cache = True
+        self.fetch_avatars()
+
+
     def refresh_avatar_panels(self):
         """Force a complete refresh of the current page of avatars"""
         if hasattr(self, 'filtered_avatars') and self.filtered_avatars:
@@ -2536,6 +3437,23 @@ class VRChatManager(QMainWindow):
             self.display_avatars(current_page_avatars)
             logger.info("Avatar panels refreshed completely")
             
+    def _show_toast(self, message, duration_ms=3000):
+        """Show a transient in-window banner (styled via the global QSS)"""
+        if not hasattr(self, '_toast'):
+            self._toast = QLabel(self)
+            self._toast.setObjectName("toast")
+            self._toast.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self._toast_timer = QTimer(self)
+            self._toast_timer.setSingleShot(True)
+            self._toast_timer.timeout.connect(self._toast.hide)
+        self._toast.setText(message)
+        self._toast.adjustSize()
+        self._toast.move((self.width() - self._toast.width()) // 2,
+                         self.height() - self._toast.height() - 40)
+        self._toast.show()
+        self._toast.raise_()
+        self._toast_timer.start(duration_ms)
+
     def update_download_progress(self, percent, message=""):
         self.file_progress.setValue(percent)
         if message:
@@ -2545,7 +3463,19 @@ class VRChatManager(QMainWindow):
         if not self.api_client:
             QMessageBox.warning(self, "Not Logged In", "Please login to download files")
             return
-        
+
+        # One transfer's state (fd, reply, counters) lives on the window;
+        # a second concurrent start would interleave its bytes into the
+        # first download's file. The avatar-card path reaches here too,
+        # so the disabled downloader button alone doesn't guarantee this.
+        if self._download_reply is not None:
+            QMessageBox.warning(
+                self,
+                "Download In Progress",
+                "Another download is still running. Please wait for it to finish."
+            )
+            return
+
         file_url = self.file_url_input.text().strip()
         output_path = self.file_output_input.text().strip()
         
@@ -2553,99 +3483,165 @@ class VRChatManager(QMainWindow):
             QMessageBox.warning(self, "Missing URL", "Please enter a VRChat file URL")
             return
         
+        # Fix URL - remove variant/security at the end if present
+        if '/variant/security' in file_url:
+            file_url = file_url.split('/variant/security')[0]
+            logger.info(f"Fixed URL by removing variant/security: {file_url}")
+
+        try:
+            # Raw fd: os.write per readyRead burst skips the BufferedWriter
+            # copy, and preallocation (below, once the size is known) gives
+            # the filesystem a chance to lay the file out contiguously
+            self._download_fd = os.open(
+                output_path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0))
+        except OSError as e:
+            self.handle_download_error(str(e))
+            return
+        self._download_path = output_path
+        self._download_last_pct = -1
+        self._download_written = 0
+        self._download_total = 0
+        self._download_write_error = None
+
         # Update UI
         self.file_status.setText("Downloading file...")
         self.file_progress.setVisible(True)
         self.file_progress.setRange(0, 100)
         self.file_progress.setValue(0)
         self.download_btn.setEnabled(False)
-        
-        # Store worker as instance attribute so it can be accessed in download_file_worker
-        self.worker = Worker(self.download_file_worker, file_url, output_path)
-        self.worker.signals.result.connect(self.handle_download_result)
-        self.worker.signals.error.connect(self.handle_download_error)
-        self.worker.signals.progress.connect(self.update_download_progress)
-        self.threadpool.start(self.worker)
-    
-    def download_file_worker(self, file_url, output_path):
+
+        # Qt's network stack drives the transfer on the event loop:
+        # bytes go socket -> file in readyRead with no Python chunk loop,
+        # and no threadpool slot is blocked for the whole download
+        request = QNetworkRequest(QUrl(file_url))
+        request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader,
+                          self.api_client.user_agent)
+        cookies = _cookies_for(self.api_client)
+        if cookies:
+            request.setRawHeader(
+                b"Cookie",
+                "; ".join(f"{k}={v}" for k, v in cookies.items()).encode('utf-8'))
+        request.setAttribute(
+            QNetworkRequest.Attribute.RedirectPolicyAttribute,
+            QNetworkRequest.RedirectPolicy.NoLessSafeRedirectPolicy)
+
+        logger.info(f"Starting download from URL: {file_url}")
+        reply = self._nam.get(request)
+        reply.readyRead.connect(partial(self._on_download_ready_read, reply))
+        reply.finished.connect(partial(self._on_download_finished, reply))
+        self._download_reply = reply
+        self._progress_timer.start()
+
+    def _on_download_ready_read(self, reply):
+        if self._download_fd is None:
+            return
+        data = reply.readAll().data()
         try:
-            logger.info(f"Starting download from URL: {file_url}")
-            
-            # Fix URL - remove variant/security at the end if present
-            if '/variant/security' in file_url:
-                file_url = file_url.split('/variant/security')[0]
-                logger.info(f"Fixed URL by removing variant/security: {file_url}")
-            
-            # Get cookies from API client
-            cookies = {}
-            if self.api_client:
-                for cookie in self.api_client.rest_client.cookie_jar:
-                    cookies[cookie.name] = cookie.value
-            
-            # Log cookies for debugging (without values for security)
-            logger.info(f"Using authentication cookies: {list(cookies.keys())}")
-            
-            # Set up headers with proper auth
-            headers = {
-                "User-Agent": self.api_client.user_agent,
-                "Accept": "*/*"  # Accept any content type
-            }
-            
-            # Make the download request with proper authentication
-            logger.info(f"Sending authenticated request to: {file_url}")
-            response = requests.get(
-                file_url,
-                headers=headers,
-                cookies=cookies,
-                stream=True  # Stream for large files
-            )
-            
-        
-            # Verify response
-            if response.status_code != 200:
-                logger.error(f"Download failed with status {response.status_code}")
-                logger.error(f"Response headers: {dict(response.headers)}")
-                logger.error(f"Response content: {response.text[:200]}")
-                raise Exception(f"Download failed with status {response.status_code}")
-            
-            # Get content length for progress tracking
-            total_size = int(response.headers.get('content-length', 0))
-            logger.info(f"Download size: {total_size} bytes")
-            
-            # Save the file with progress updates
-            downloaded = 0
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        # Update progress
-                        if total_size > 0:
-                            percent = int(downloaded * 100 / total_size)
-                            # Only update UI every 1% to prevent too many updates
-                            if percent % 1 == 0:
-                                self.worker.signals.progress.emit(
-                                    percent, 
-                                    f"Downloading file... {downloaded/(1024*1024):.1f} MB / {total_size/(1024*1024):.1f} MB ({percent}%)"
-                                )
-                                
-                        # Log progress for large files
-                        if total_size > 1000000 and downloaded % 5000000 == 0:  # Every 5MB
-                            percent = int(downloaded * 100 / total_size) if total_size > 0 else 0
-                            logger.info(f"Download progress: {percent}% ({downloaded}/{total_size} bytes)")
-            
-            logger.info(f"Download completed successfully: {output_path}")
-            
-            return {
-                "success": True,
-                "path": output_path
-            }
-        except Exception as e:
-            logger.error(f"Download error: {str(e)}")
-            traceback.print_exc()
-            raise
-    
+            # os.write may do a short write; loop until the burst is on
+            # disk. An OSError escaping this Qt-invoked slot would abort
+            # the whole process, so disk-full has to be caught here.
+            view = memoryview(data)
+            while view:
+                n = os.write(self._download_fd, view)
+                view = view[n:]
+        except OSError as e:
+            self._abort_download_transfer(str(e), reply)
+            return
+        self._download_written += len(data)
+
+    def _abort_download_transfer(self, message, reply):
+        """Tear down the fd and partial file after a local write error"""
+        logger.error(f"Download write failed: {message}")
+        self._download_write_error = message
+        if self._download_fd is not None:
+            try:
+                os.close(self._download_fd)
+            except OSError:
+                pass
+            self._download_fd = None
+        try:
+            os.remove(self._download_path)
+        except OSError:
+            pass
+        # finished fires next and routes to handle_download_error
+        reply.abort()
+
+    def _pump_download_progress(self):
+        """Sample transfer progress on a fixed cadence.
+
+        readyRead only bumps a byte counter; this timer turns it into UI
+        updates at 20 Hz, so the GUI pace is independent of how often the
+        network stack delivers packets.
+        """
+        reply = self._download_reply
+        if reply is None:
+            self._progress_timer.stop()
+            return
+        if not self._download_total:
+            total = reply.header(QNetworkRequest.KnownHeaders.ContentLengthHeader)
+            if not total:
+                return  # Headers not in yet (or size unknown)
+            self._download_total = int(total)
+            if self._download_fd is not None:
+                # Now that the size is known, reserve the space up front
+                try:
+                    if hasattr(os, 'posix_fallocate'):
+                        os.posix_fallocate(self._download_fd, 0, self._download_total)
+                    else:
+                        os.ftruncate(self._download_fd, self._download_total)
+                except OSError:
+                    pass  # Preallocation is best-effort
+        received = self._download_written
+        percent = int(received * 100 / self._download_total)
+        # Only touch the progress bar when the integer percent moves
+        if percent == self._download_last_pct:
+            return
+        self._download_last_pct = percent
+        self.update_download_progress(
+            percent,
+            f"Downloading file... {received/(1024*1024):.1f} MB / "
+            f"{self._download_total/(1024*1024):.1f} MB ({percent}%)"
+        )
+
+    def _on_download_finished(self, reply):
+        self._progress_timer.stop()
+        if self._download_fd is not None:
+            self._on_download_ready_read(reply)  # Drain any tail bytes
+        # The drain may have hit a write error and torn the fd down
+        if self._download_fd is not None:
+            try:
+                if self._download_written != self._download_total:
+                    # Trim any unused preallocated space
+                    os.ftruncate(self._download_fd, self._download_written)
+            except OSError as e:
+                self._download_write_error = str(e)
+            try:
+                # close() is where a full disk finally reports deferred
+                # write failures, so it counts as a write error too
+                os.close(self._download_fd)
+            except OSError as e:
+                self._download_write_error = self._download_write_error or str(e)
+            self._download_fd = None
+        self._download_reply = None
+        reply.deleteLater()
+
+        write_error = self._download_write_error
+        self._download_write_error = None
+        if reply.error() == QNetworkReply.NetworkError.NoError and write_error is None:
+            logger.info(f"Download completed successfully: {self._download_path}")
+            self.handle_download_result({"success": True, "path": self._download_path})
+        else:
+            message = write_error or reply.errorString()
+            logger.error(f"Download failed: {message}")
+            # Don't leave a truncated file behind
+            try:
+                os.remove(self._download_path)
+            except OSError:
+                pass
+            self.handle_download_error(message)
+
+
     def handle_download_result(self, result):
         # Update UI
         self.file_progress.setVisible(False)
@@ -2653,17 +3649,14 @@ class VRChatManager(QMainWindow):
         
         if result["success"]:
             self.file_status.setText(f"File downloaded successfully to: {result['path']}")
-            
+
             # Create a success animation
-            theme = app_theme["dark" if is_dark_mode else "light"]
+            theme = _theme()
             self.file_status.setStyleSheet(f"color: {theme['success']}; font-weight: bold;")
-            
-            # Show completion dialog
-            QMessageBox.information(
-                self, 
-                "Download Complete", 
-                f"File has been downloaded to:\n{result['path']}"
-            )
+
+            # Non-modal banner: doesn't block the event loop, so further
+            # downloads can start without dismissing a dialog first
+            self._show_toast(f"Downloaded: {result['path']}")
         else:
             self.file_status.setText("Download failed")
             self.file_status.setStyleSheet(f"color: {theme['error']}; font-weight: bold;")
@@ -2673,7 +3666,7 @@ class VRChatManager(QMainWindow):
         self.file_progress.setVisible(False)
         self.download_btn.setEnabled(True)
         
-        theme = app_theme["dark" if is_dark_mode else "light"]
+        theme = _theme()
         self.file_status.setText(f"Error: {error}")
         self.file_status.setStyleSheet(f"color: {theme['error']}; font-weight: bold;")
         
@@ -2684,23 +3677,18 @@ class LogHandler(logging.Handler):
     def __init__(self, text_widget):
         super().__init__()
         self.text_widget = text_widget
-        self.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        # An explicit datefmt skips the default asctime path, which
+        # formats the time twice per record to append milliseconds
+        self.setFormatter(logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'))
         
     def emit(self, record):
         msg = self.format(record)
-        
-        # Add color based on log level
-        color = {
-            logging.DEBUG: "#6c757d",    # Gray
-            logging.INFO: "#0d6efd",     # Blue
-            logging.WARNING: "#fd7e14",  # Orange
-            logging.ERROR: "#dc3545",    # Red
-            logging.CRITICAL: "#7f0000"  # Dark red
-        }.get(record.levelno, "#212529")
-        
-        # Add to text widget
-        self.text_widget.append(f'<span style="color:{color}">{msg}</span>')
-        
+
+        # Plain-text append: no HTML parse or rich-text layout per line
+        self.text_widget.appendPlainText(msg)
+
         # Auto-scroll to bottom
         self.text_widget.verticalScrollBar().setValue(
             self.text_widget.verticalScrollBar().maximum()
@@ -2713,6 +3701,11 @@ def main():
     # Create application
     app = QApplication(sys.argv)
     app.setStyle(QStyleFactory.create("Fusion"))
+
+    # Give thumbnails room in the shared pixmap cache (64 MB): enough for
+    # several pages of 300x180 scaled thumbnails plus Qt's own assets, so
+    # paging back and forth stays a hash lookup instead of a re-decode
+    QPixmapCache.setCacheLimit(64 * 1024)
     
     # Set modern font
     font_id = QFontDatabase.addApplicationFont(":/fonts/segoe-ui.ttf")
@@ -2722,34 +3715,42 @@ def main():
     else:
         app.setFont(QFont("Segoe UI", 10))
     
-    # Create splash screen
-    splash_pixmap = QPixmap(600, 350)
-    painter = QPainter(splash_pixmap)
-    
-    # Create a gradient background
-    gradient = QLinearGradient(0, 0, 600, 350)
-    gradient.setColorAt(0, QColor("#6C5CE7"))  # Purple
-    gradient.setColorAt(1, QColor("#00CECE"))  # Teal
-    painter.fillRect(0, 0, 600, 350, gradient)
-    
-    # Add app name
-    painter.setPen(QColor("white"))
-    font = QFont("Segoe UI", 28, QFont.Weight.Bold)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 120, 600, 50), Qt.AlignmentFlag.AlignCenter, APP_NAME)
-    
-    # Add version
-    font = QFont("Segoe UI", 14)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 180, 600, 30), Qt.AlignmentFlag.AlignCenter, f"Version {APP_VERSION}")
-    
-    # Add loading text
-    font = QFont("Segoe UI", 12)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 280, 600, 30), Qt.AlignmentFlag.AlignCenter, "Loading...")
-    
-    painter.end()
-    
+    # Create splash screen. The composition only changes with the app
+    # version, so the first launch renders and caches it as a PNG; later
+    # launches load that file and skip the gradient fill and the three
+    # rounds of font shaping (the version key retires stale renders).
+    splash_path = os.path.join(CACHE_FOLDER, f"splash_{APP_VERSION}.png")
+    splash_pixmap = QPixmap(splash_path)
+    if splash_pixmap.isNull():
+        splash_pixmap = QPixmap(600, 350)
+        painter = QPainter(splash_pixmap)
+
+        # Create a gradient background
+        gradient = QLinearGradient(0, 0, 600, 350)
+        gradient.setColorAt(0, QColor("#6C5CE7"))  # Purple
+        gradient.setColorAt(1, QColor("#00CECE"))  # Teal
+        painter.fillRect(0, 0, 600, 350, gradient)
+
+        # Add app name
+        painter.setPen(QColor("white"))
+        font = QFont("Segoe UI", 28, QFont.Weight.Bold)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 120, 600, 50), Qt.AlignmentFlag.AlignCenter, APP_NAME)
+
+        # Add version
+        font = QFont("Segoe UI", 14)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 180, 600, 30), Qt.AlignmentFlag.AlignCenter, f"Version {APP_VERSION}")
+
+        # Add loading text
+        font = QFont("Segoe UI", 12)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 280, 600, 30), Qt.AlignmentFlag.AlignCenter, "Loading...")
+
+        painter.end()
+        splash_pixmap.save(splash_path, "PNG")
+
+
     splash = QSplashScreen(splash_pixmap)
     splash.show()
     app.processEvents()
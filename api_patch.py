@@ -11,8 +11,16 @@ def apply_patches():
     """
     Apply monkey patches to the vrchatapi package to handle API changes.
     """
+    # Idempotent: calling this again (e.g. on re-login) must not wrap the
+    # already-patched property in another function-call layer, which would
+    # slow every attribute access on CurrentUser
+    if getattr(CurrentUser, '_asset_url_patched', False):
+        logger.debug("VRChat API client patches already applied, skipping")
+        return
+    CurrentUser._asset_url_patched = True
+
     logger.info("Applying VRChat API client patches")
-    
+
     # Direct patch of the property setter by replacing it completely
     # We need to find where the property is defined
     property_dict = CurrentUser.__dict__